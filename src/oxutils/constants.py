@@ -1,5 +1,6 @@
 ORGANIZATION_QUERY_KEY = 'organization_id'
 ORGANIZATION_HEADER_KEY = 'X-Organization-ID'
+ORGANIZATION_HEADER_META_KEY = 'HTTP_' + ORGANIZATION_HEADER_KEY.upper().replace('-', '_')
 ORGANIZATION_TOKEN_COOKIE_KEY = 'organization_token'
 OXILIERE_SERVICE_TOKEN = 'X-Oxiliere-Token'
 
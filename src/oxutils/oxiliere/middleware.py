@@ -14,7 +14,7 @@ from django_tenants.utils import (
     has_multi_type_tenants,
 )
 
-from oxutils.constants import ORGANIZATION_HEADER_KEY
+from oxutils.constants import ORGANIZATION_HEADER_KEY, ORGANIZATION_HEADER_META_KEY
 from oxutils.oxiliere.cacheops import (
     delete_cached_tenant_token,
     get_cached_tenant_token,
@@ -40,8 +40,9 @@ class TenantMainMiddleware(MiddlewareMixin):
     @staticmethod
     def get_org_id_from_request(request):
         """Extracts organization ID from request header X-Organization-ID."""
-        custom = "HTTP_" + ORGANIZATION_HEADER_KEY.upper().replace("-", "_")
-        return request.headers.get(ORGANIZATION_HEADER_KEY) or request.META.get(custom)
+        return request.headers.get(ORGANIZATION_HEADER_KEY) or request.META.get(
+            ORGANIZATION_HEADER_META_KEY
+        )
 
     def get_tenant(self, oxi_id):
         """Get tenant by oxi_id instead of domain."""
@@ -1,10 +1,30 @@
-from .views import WeasyTemplateResponse, WeasyTemplateResponseMixin, WeasyTemplateView
-from .printer import Printer
+"""
+Oxutils PDF Module
 
+WeasyPrint-based PDF views and the standalone Printer.
+"""
 
-__all__ = [
-    'WeasyTemplateResponse',
-    'WeasyTemplateResponseMixin',
-    'WeasyTemplateView',
-    'Printer',
-]
+# WeasyPrint is slow to import and needs native libraries, so the public
+# names are resolved lazily: importing oxutils.pdf alone does not load it.
+# Use: from oxutils.pdf import Printer
+
+_LAZY_ATTRS = {
+    'WeasyTemplateResponse': 'views',
+    'WeasyTemplateResponseMixin': 'views',
+    'WeasyTemplateView': 'views',
+    'Printer': 'printer',
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    """Lazy import of the PDF views, Printer and submodules."""
+    from importlib import import_module
+
+    if name in _LAZY_ATTRS:
+        module = import_module(f'{__name__}.{_LAZY_ATTRS[name]}')
+        return getattr(module, name)
+    if name in ('printer', 'utils', 'views'):
+        return import_module(f'{__name__}.{name}')
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
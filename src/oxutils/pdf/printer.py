@@ -1,22 +1,208 @@
+import datetime
+import io
+import os
+import re
+import threading
+import uuid
+from contextlib import contextmanager
+from decimal import Decimal
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from urllib.parse import urljoin, urlparse
+
 import weasyprint
 from django.conf import settings
 from django.template.loader import render_to_string
 
-from oxutils.pdf.utils import django_url_fetcher
+from oxutils.pdf.utils import django_url_fetcher, prefetch_urls
+
+_FONT_CONFIGS = threading.local()
+
+
+def _get_font_config():
+    """
+    Return this thread's FontConfiguration, creating it on first use.
+
+    Building one scans the system fonts, so it is reused across documents,
+    but never shared between threads: ``@font-face`` rules register fonts
+    into it while a document is parsed and rendered.
+    """
+    font_config = getattr(_FONT_CONFIGS, 'font_config', None)
+    if font_config is None:
+        font_config = _FONT_CONFIGS.font_config = weasyprint.text.fonts.FontConfiguration()
+    return font_config
+
+
+def _get_mtime(path):
+    try:
+        return os.stat(path).st_mtime
+    except (OSError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=128)
+def _parse_css(value, mtime, base_url, url_fetcher, font_config):
+    """
+    Parse a stylesheet once per (source, mtime, base_url, fetcher, font config).
+
+    Only for local files: URLs and other sources without an mtime could
+    change unseen, so they are parsed on every render.
+    """
+    return weasyprint.CSS(
+        value,
+        base_url=base_url,
+        url_fetcher=url_fetcher,
+        font_config=font_config,
+    )
+
+
+_FROZEN_SCALARS = (
+    str, bytes, int, float, bool, type(None), Decimal, uuid.UUID,
+    datetime.date, datetime.time, datetime.timedelta,
+)
+
+
+def _freeze(obj):
+    """Turn plain context data into a hashable key; raise TypeError otherwise."""
+    if isinstance(obj, dict):
+        return (dict, frozenset((key, _freeze(value)) for key, value in obj.items()))
+    if isinstance(obj, (list, tuple)):
+        return (type(obj), tuple(_freeze(value) for value in obj))
+    if isinstance(obj, (set, frozenset)):
+        return (frozenset, frozenset(_freeze(value) for value in obj))
+    if isinstance(obj, _FROZEN_SCALARS):
+        # Tag with the type so that e.g. True, 1 and 1.0 do not share a key.
+        return (type(obj), obj)
+    raise TypeError(f"Cannot freeze {type(obj).__name__!r} for template caching")
+
+
+class _FrozenContext:
+    """Hashable wrapper comparing contexts by value, keeping the original for rendering."""
+
+    __slots__ = ('context', '_key', '_hash')
+
+    def __init__(self, context):
+        self.context = context
+        self._key = _freeze(context)
+        # Tuples do not cache their hash; compute it once for the nested key.
+        self._hash = hash(self._key)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, _FrozenContext)
+            and self._hash == other._hash
+            and self._key == other._key
+        )
+
+
+@lru_cache(maxsize=256)
+def _render_cached(template_name, frozen_context):
+    return render_to_string(template_name, frozen_context.context)
+
+
+_BUFFER_POOL = threading.local()
+_BUFFER_POOL_SIZE = 4
+
+
+def _acquire_buffer():
+    """Take an empty BytesIO from this thread's pool, or create one."""
+    buffers = getattr(_BUFFER_POOL, 'buffers', None)
+    if buffers:
+        return buffers.pop()
+    return io.BytesIO()
+
+
+def _release_buffer(buf):
+    """Reset ``buf`` and return it to this thread's pool unless the pool is full."""
+    buf.seek(0)
+    buf.truncate(0)
+    buffers = getattr(_BUFFER_POOL, 'buffers', None)
+    if buffers is None:
+        buffers = _BUFFER_POOL.buffers = []
+    if len(buffers) < _BUFFER_POOL_SIZE:
+        buffers.append(buf)
+
+
+_BATCH_ANCHOR_PREFIX = 'oxutils-batch-'
+
+# CSS depending on a page's position in its document: page counters and the
+# :first/:left/:right/:blank page selectors. Laid out as one batch, these
+# would count pages across every context instead of per PDF.
+_PAGE_DEPENDENT_CSS_RE = re.compile(
+    r'counters?\(\s*pages?\s*[,)]|:(?:first|left|right|blank)(?![\w-])',
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=128)
+def _is_page_dependent_stylesheet(path, mtime):
+    """Scan a local stylesheet once per (path, mtime) for page-dependent CSS."""
+    with open(path, encoding='utf-8', errors='replace') as stylesheet:  # noqa: PTH123
+        return _PAGE_DEPENDENT_CSS_RE.search(stylesheet.read()) is not None
+
+# Matches <link> tags pointing at bundled / screen-only assets that have no
+# use in print output. Opt in through Printer.strip_link_patterns.
+SCREEN_ONLY_LINK_RE = re.compile(
+    r'<link[^>]+href="[^"]*(?:bundle|screen-only)[^"]*"[^>]*>',
+    re.IGNORECASE,
+)
+
+
+_ASSET_URL_RE = re.compile(
+    r'<(?:img|link|image|source)\b[^>]*?\s(?:src|href|xlink:href)\s*=\s*["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+_PREFETCH_SCHEMES = frozenset({'file', 'http', 'https'})
 
 
 class Printer:
     template_name = None
-    pdf_stylesheets = []
-    pdf_options = {}
+    pdf_stylesheets = ()
+    pdf_options = MappingProxyType({})
+    # Opt-in: cached HTML is served for any later render of the same
+    # template and context, even if its output depends on time or globals.
+    cache_template = False
+    strip_link_patterns = ()
+    prefetch = False
 
-    def __init__(self, template_name=None, context=None, stylesheets=None, options=None, base_url=None):
+    def __init__(
+        self,
+        template_name=None,
+        context=None,
+        stylesheets=None,
+        options=None,
+        base_url=None,
+        cache_template=None,
+        prefetch=None,
+    ):
         self.template_name = template_name or self.template_name
+        if cache_template is not None:
+            self.cache_template = cache_template
+        if prefetch is not None:
+            self.prefetch = prefetch
         self.context = context or {}
         self._stylesheets = stylesheets or self.pdf_stylesheets
         self._options = options.copy() if options else self.pdf_options.copy()
+        # Decoded images keyed by URL, reused by every document this printer
+        # renders (extra contexts, batches) and released with it. WeasyPrint
+        # also stores image data it reads back when writing, so the cache is
+        # scoped rather than bounded: evicting an entry would break a write.
+        self._options.setdefault('cache', {})
         self._base_url = base_url
 
+    @property
+    def context(self):
+        return self._context
+
+    @context.setter
+    def context(self, context):
+        self._context = context
+        # The cached layout was built from the previous context.
+        self.__dict__.pop('rendered_document', None)
+
     def get_context_data(self, **kwargs):
         context = self.context.copy()
         context.update(kwargs)
@@ -34,33 +220,102 @@ class Printer:
         return django_url_fetcher
 
     def get_font_config(self):
-        return weasyprint.text.fonts.FontConfiguration()
+        return _get_font_config()
+
+    def get_prefetch_urls(self, html_content, base_url):
+        urls = []
+        for value in _ASSET_URL_RE.findall(html_content):
+            url = urljoin(base_url, value)
+            if urlparse(url).scheme in _PREFETCH_SCHEMES:
+                urls.append(url)
+        return urls
 
     def get_css(self, base_url, url_fetcher, font_config):
-        return [
-            weasyprint.CSS(
-                value,
-                base_url=base_url,
-                url_fetcher=url_fetcher,
-                font_config=font_config,
-            )
-            for value in self._stylesheets
-        ]
+        css = []
+        for value in self._stylesheets:
+            mtime = _get_mtime(value) if isinstance(value, str) else None
+            if mtime is not None:
+                css.append(_parse_css(value, mtime, base_url, url_fetcher, font_config))
+            else:
+                css.append(
+                    weasyprint.CSS(
+                        value,
+                        base_url=base_url,
+                        url_fetcher=url_fetcher,
+                        font_config=font_config,
+                    )
+                )
+        return css
+
+    def is_page_dependent(self, html_fragments):
+        """
+        Whether the rendered HTML or the local stylesheets number or select
+        pages, so that a document cannot be laid out as part of a batch.
+
+        Stylesheet URLs and ``weasyprint.CSS`` objects are not inspected.
+        """
+        if any(_PAGE_DEPENDENT_CSS_RE.search(html) for html in html_fragments):
+            return True
+        for value in self._stylesheets:
+            mtime = _get_mtime(value) if isinstance(value, str) else None
+            if mtime is not None and _is_page_dependent_stylesheet(value, mtime):
+                return True
+        return False
+
+    def strip_links(self, html):
+        for pattern in self.strip_link_patterns:
+            html = pattern.sub('', html)
+        return html
 
     def render_html(self, **kwargs):
+        return self.strip_links(self._render_template(**kwargs))
+
+    def _render_template(self, **kwargs):
         context = self.get_context_data(**kwargs)
+        if self.cache_template and not settings.DEBUG:
+            # Only contexts made of plain data are cached: model instances and
+            # other objects may change between renders without changing hash.
+            # Skipped in DEBUG so template edits show up immediately.
+            try:
+                frozen_context = _FrozenContext(context)
+            except TypeError:
+                pass
+            else:
+                return _render_cached(self.template_name, frozen_context)
         return render_to_string(self.template_name, context)
 
+    @cached_property
+    def rendered_document(self):
+        """
+        Document laid out from the printer's own context, shared by every write.
+
+        Reassigning :attr:`context` discards it; mutating the context in
+        place does not, so assign a new dict to change what is printed.
+        """
+        return self.render_document(self.render_html())
+
     def get_document(self, **kwargs):
+        if kwargs:
+            return self.render_document(self.render_html(**kwargs))
+        return self.rendered_document
+
+    def render_document(self, html_content):
         base_url = self.get_base_url()
         url_fetcher = self.get_url_fetcher()
         font_config = self.get_font_config()
 
-        html_content = self.render_html(**kwargs)
+        # Stylesheets get the base fetcher: the prefetching one is rebuilt on
+        # every render and would defeat the parsed-CSS cache keyed on it.
+        html_url_fetcher = url_fetcher
+        if self.prefetch:
+            urls = self.get_prefetch_urls(html_content, base_url)
+            if urls:
+                html_url_fetcher = prefetch_urls(urls, url_fetcher)
+
         html = weasyprint.HTML(
             string=html_content,
             base_url=base_url,
-            url_fetcher=url_fetcher,
+            url_fetcher=html_url_fetcher,
         )
 
         self._options.setdefault(
@@ -74,8 +329,81 @@ class Printer:
         )
 
     def write_pdf(self, output=None, **kwargs):
+        """
+        Return the PDF as bytes, or stream it into ``output`` and return ``output``.
+
+        ``output`` may be a file object or a filename; writing to it avoids
+        holding a second full copy of the PDF in memory.
+        """
         document = self.get_document(**kwargs)
-        return document.write_pdf(target=output, **self._options)
+        if output is None:
+            return document.write_pdf(**self._options)
+        document.write_pdf(target=output, **self._options)
+        return output
 
     def write_object(self, file_obj, **kwargs):
         return self.write_pdf(output=file_obj, **kwargs)
+
+    @contextmanager
+    def write_pdf_to_pooled_buffer(self, **kwargs):
+        """
+        Write the PDF into a pooled BytesIO and yield it, rewound to the start.
+
+        The buffer is reset and returned to a per-thread pool on exit, so it
+        must not be used outside the ``with`` block.
+        """
+        buf = _acquire_buffer()
+        try:
+            self.write_pdf(output=buf, **kwargs)
+            buf.seek(0)
+            yield buf
+        finally:
+            _release_buffer(buf)
+
+    def write_pdfs_batch(self, contexts):
+        """
+        Render one PDF per context, with a single WeasyPrint layout pass when possible.
+
+        Each context is rendered with the printer's template, the fragments
+        are joined with forced page breaks and laid out together, then the
+        pages are split back per context using an anchor at the start of
+        each fragment.
+
+        Pages keep the numbering of the combined layout, so templates using
+        page counters or ``@page :first``-style selectors (see
+        :meth:`is_page_dependent`) are laid out once per context instead.
+        Element ids are shared by the whole batch: ``target-counter()`` and
+        internal links to an id repeated across contexts resolve to its
+        first occurrence.
+        """
+        if not contexts:
+            return []
+
+        htmls = [self.render_html(**context) for context in contexts]
+        if self.is_page_dependent(htmls):
+            return [
+                self.render_document(html).write_pdf(**self._options)
+                for html in htmls
+            ]
+
+        fragments = []
+        for index, html in enumerate(htmls):
+            style = 'break-before: page' if index else ''
+            fragments.append(
+                f'<div id="{_BATCH_ANCHOR_PREFIX}{index}" style="{style}">{html}</div>'
+            )
+
+        document = self.render_document(''.join(fragments))
+        pages = document.pages
+
+        starts = {}
+        for page_number, page in enumerate(pages):
+            for anchor in page.anchors:
+                if anchor.startswith(_BATCH_ANCHOR_PREFIX):
+                    starts.setdefault(int(anchor[len(_BATCH_ANCHOR_PREFIX):]), page_number)
+
+        bounds = [starts[index] for index in range(len(contexts))] + [len(pages)]
+        return [
+            document.copy(pages[bounds[index]:bounds[index + 1]]).write_pdf(**self._options)
+            for index in range(len(contexts))
+        ]
@@ -1,6 +1,7 @@
 import logging
 import mimetypes
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
@@ -16,6 +17,27 @@ from django.urls import get_script_prefix
 
 log = logging.getLogger(__name__)
 
+# Extensions commonly referenced from PDF templates; anything else goes
+# through mimetypes.guess_type.
+_MIME_TYPES = {
+    '.css': 'text/css',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.svg': 'image/svg+xml',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+}
+
+
+def guess_mime_type(url):
+    mime_type = _MIME_TYPES.get(os.path.splitext(urlparse(url).path)[1].lower())
+    if mime_type:
+        return mime_type, None
+    return mimetypes.guess_type(url)
+
 
 @lru_cache(maxsize=None)
 def get_reversed_hashed_files():
@@ -26,7 +48,7 @@ def django_url_fetcher(url, *args, **kwargs):
     # attempt to load file:// paths to Django MEDIA or STATIC files directly from disk
     if url.startswith('file:'):
         log.debug('Attempt to fetch from %s', url)
-        mime_type, encoding = mimetypes.guess_type(url)
+        mime_type, encoding = guess_mime_type(url)
         url_path = urlparse(url).path
         data = {
             'mime_type': mime_type,
@@ -72,23 +94,83 @@ def django_url_fetcher(url, *args, **kwargs):
     return weasyprint.default_url_fetcher(url, *args, **kwargs)
 
 
+def _resolve_static_root(static_root, relative_path):
+    if not static_root:
+        return None
+    static_root_path = os.path.join(static_root, relative_path)
+    if os.path.exists(static_root_path):
+        return static_root_path
+    return None
+
+
+# Production lookups keyed by (STATIC_ROOT, relative path). Only hits are
+# kept, so a file collected after the first miss is still picked up.
+_STATIC_ROOT_PATHS = {}
+
+
+def _resolve_static_root_cached(static_root, relative_path):
+    key = (static_root, relative_path)
+    path = _STATIC_ROOT_PATHS.get(key)
+    if path is None:
+        path = _resolve_static_root(static_root, relative_path)
+        if path is not None:
+            _STATIC_ROOT_PATHS[key] = path
+    return path
+
+
+def prefetch_urls(urls, url_fetcher=django_url_fetcher, max_workers=8):
+    """
+    Fetch ``urls`` concurrently and return a URL fetcher serving them from memory.
+
+    WeasyPrint fetches resources one at a time while laying out a document;
+    warming them in a thread pool first overlaps the I/O. URLs that were not
+    prefetched, or failed to, are passed to ``url_fetcher`` as usual.
+    """
+    def load(url):
+        try:
+            result = dict(url_fetcher(url))
+        except Exception as exc:
+            log.debug('Prefetch of %s failed: %s', url, exc)
+            return url, None
+        if 'file_obj' in result:
+            file_obj = result.pop('file_obj')
+            try:
+                result['string'] = file_obj.read()
+            finally:
+                file_obj.close()
+        return url, result
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        prefetched = {
+            url: result
+            for url, result in executor.map(load, set(urls))
+            if result is not None
+        }
+
+    def prefetched_url_fetcher(url, *args, **kwargs):
+        result = prefetched.get(url)
+        if result is None:
+            return url_fetcher(url, *args, **kwargs)
+        return dict(result)
+
+    return prefetched_url_fetcher
+
+
 def get_stylesheet_path(relative_path):
     if settings.DEBUG:
         path = find(relative_path)
         if path:
             return path
-    print('Le DEBUG est False')
-    static_root_path = os.path.join(settings.STATIC_ROOT, relative_path)
-    if os.path.exists(static_root_path):
-        return static_root_path
-    
-    return None
+        return _resolve_static_root(settings.STATIC_ROOT, relative_path)
+    return _resolve_static_root_cached(settings.STATIC_ROOT, relative_path)
 
 
 def get_stylesheets(*relative_paths):
-    stylesheets = []
-    for path in relative_paths:
-        resolved = get_stylesheet_path(path)
-        if resolved:
-            stylesheets.append(resolved)
-    return stylesheets
+    # Keep only the last occurrence of a repeated path: the earlier copies
+    # are overridden by it in the cascade, so dropping them changes nothing
+    # and each path is resolved once.
+    unique_paths = reversed(dict.fromkeys(reversed(relative_paths)))
+    # Finder instances are already cached by django.contrib.staticfiles
+    # (get_finder is an lru_cache), so one pass over the paths is enough.
+    resolved = map(get_stylesheet_path, unique_paths)
+    return [path for path in resolved if path]
@@ -1,12 +1,23 @@
+from functools import lru_cache
+from types import MappingProxyType
+
 import weasyprint
 
 from django.conf import settings
 from django.template.response import TemplateResponse
+from django.utils.http import content_disposition_header
 from django.views.generic.base import ContextMixin, TemplateResponseMixin, View
 
+from oxutils.pdf.printer import _get_font_config
 from oxutils.pdf.utils import django_url_fetcher
 
 
+@lru_cache(maxsize=256)
+def _content_disposition(filename, attachment):
+    """Build the Content-Disposition value, RFC 5987-encoding non-ASCII names."""
+    return content_disposition_header(attachment, filename)
+
+
 class WeasyTemplateResponse(TemplateResponse):
     def __init__(
             self,
@@ -47,7 +58,8 @@ class WeasyTemplateResponse(TemplateResponse):
         :param options: dictionary of options passed to WeasyPrint
         """
         self._stylesheets = stylesheets or []
-        self._options = options.copy() if options else {}
+        # Never mutated: get_document() merges the stylesheets into a new dict.
+        self._options = options or {}
 
         kwargs = dict(
             context=context,
@@ -60,8 +72,7 @@ class WeasyTemplateResponse(TemplateResponse):
         super().__init__(request, template, **kwargs)
 
         if filename:
-            display = 'attachment' if attachment else 'inline'
-            self['Content-Disposition'] = f'{display};filename="{filename}"'
+            self['Content-Disposition'] = _content_disposition(filename, attachment)
 
     def get_base_url(self):
         """
@@ -83,8 +94,12 @@ class WeasyTemplateResponse(TemplateResponse):
     def get_font_config(self):
         """
         A FreeType font configuration to handle @font-config rules.
+
+        One per thread, shared with :class:`~oxutils.pdf.printer.Printer`:
+        building one scans the system fonts, which is too slow to repeat on
+        every request, and ``@font-face`` rules write into it while rendering.
         """
-        return weasyprint.text.fonts.FontConfiguration()
+        return _get_font_config()
 
     def get_css(self, base_url, url_fetcher, font_config):
         """
@@ -120,10 +135,10 @@ class WeasyTemplateResponse(TemplateResponse):
             url_fetcher=url_fetcher,
         )
 
-        self._options.setdefault(
-            'stylesheets',
-            self.get_css(base_url, url_fetcher, font_config),
-        )
+        if 'stylesheets' not in self._options:
+            self._options = self._options | {
+                'stylesheets': self.get_css(base_url, url_fetcher, font_config),
+            }
 
         return html.render(
             font_config=font_config,
@@ -147,8 +162,10 @@ class WeasyTemplateResponseMixin(TemplateResponseMixin):
     content_type = 'application/pdf'
     pdf_filename = None
     pdf_attachment = True
-    pdf_stylesheets = []
-    pdf_options = {}
+    # Read-only defaults, returned as-is by the getters: override them in
+    # subclasses rather than mutating them in place.
+    pdf_stylesheets = ()
+    pdf_options = MappingProxyType({})
 
     def get_pdf_filename(self):
         """
@@ -163,15 +180,17 @@ class WeasyTemplateResponseMixin(TemplateResponseMixin):
 
     def get_pdf_stylesheets(self):
         """
-        Returns a list of stylesheet filenames to use when rendering.
+        Returns a sequence of stylesheet filenames to use when rendering.
 
-        :rtype: :func:`list`
+        :rtype: :func:`list` or :func:`tuple`
         """
         return self.pdf_stylesheets
 
     def get_pdf_options(self):
         """
-        Returns dictionary of WeasyPrint options.
+        Returns a mapping of WeasyPrint options.
+
+        The response never mutates it, so it is returned without copying.
         """
         return self.pdf_options
 
@@ -1,5 +1,7 @@
 # actions.py
 
+from functools import lru_cache
+
 READ = "r"
 WRITE = "w"
 DELETE = "d"
@@ -24,24 +26,56 @@ def collapse_actions(actions: list[str]) -> set[str]:
     ['w','r']     -> {'w'}
     ['r']         -> {'r'}
     """
-    actions = set(actions)
+    mask = _mask(actions)
+    if mask is None:
+        return set(_collapse(frozenset(actions)))
+    return set(_COLLAPSE_TABLE[mask])
+
+
+def expand_actions(actions: list[str]) -> list[str]:
+    """
+    ['w']        -> ['w', 'r']
+    ['d']        -> ['d', 'w', 'r']
+    ['a', 'w']   -> ['a', 'w', 'r']
+    """
+    mask = _mask(actions)
+    if mask is None:
+        return list(_expand(frozenset(actions)))
+    return list(_EXPAND_TABLE[mask])
+
+
+_ACTION_BITS = {action: 1 << index for index, action in enumerate(ACTIONS)}
+
+
+def _mask(actions) -> int | None:
+    """Return the bitmask of ``actions``, or None if one is not a known action."""
+    mask = 0
+    for action in actions:
+        bit = _ACTION_BITS.get(action)
+        if bit is None:
+            return None
+        mask |= bit
+    return mask
+
+
+# Unknown action codes (e.g. legacy values stored in grants) cannot be
+# looked up by bitmask; they go through these memoized implementations.
+
+@lru_cache(maxsize=64)
+def _collapse(actions: frozenset[str]) -> frozenset[str]:
     roots = set(actions)
 
     # Remove all implied actions from roots
-    for action in list(roots):
+    for action in actions:
         if action in ACTION_HIERARCHY:
             implied = ACTION_HIERARCHY[action]
             roots -= implied
 
-    return roots
+    return frozenset(roots)
 
 
-def expand_actions(actions: list[str]) -> list[str]:
-    """
-    ['w']        -> ['w', 'r']
-    ['d']        -> ['d', 'w', 'r']
-    ['a', 'w']   -> ['a', 'w', 'r']
-    """
+@lru_cache(maxsize=64)
+def _expand(actions: frozenset[str]) -> tuple[str, ...]:
     expanded = set(actions)
 
     stack = list(actions)
@@ -54,4 +88,17 @@ def expand_actions(actions: list[str]) -> list[str]:
                 expanded.add(a)
                 stack.append(a)
 
-    return sorted(expanded)
+    return tuple(sorted(expanded))
+
+
+def _subset(mask: int) -> frozenset[str]:
+    return frozenset(action for action, bit in _ACTION_BITS.items() if mask & bit)
+
+
+# Every subset of the known actions, indexed by bitmask: 2**5 = 32 entries.
+_EXPAND_TABLE = tuple(
+    _expand.__wrapped__(_subset(mask)) for mask in range(1 << len(ACTIONS))
+)
+_COLLAPSE_TABLE = tuple(
+    _collapse.__wrapped__(_subset(mask)) for mask in range(1 << len(ACTIONS))
+)
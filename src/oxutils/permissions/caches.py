@@ -6,7 +6,7 @@ CACHE_CHECK_PERMISSION = getattr(settings, 'CACHE_CHECK_PERMISSION', False)
 
 if CACHE_CHECK_PERMISSION:
     from cacheops import cached_as
-    from .models import Grant
+    from .models import Grant, Group, Role
     from .utils import check, any_action_check, any_permission_check
 
     @cached_as(Grant, timeout=60*15)
@@ -20,7 +20,16 @@ if CACHE_CHECK_PERMISSION:
     @cached_as(Grant, timeout=60*15)
     def cache_any_permission_check(user, *str_perms):
         return any_permission_check(user, *str_perms)
+
+    @cached_as(Role, timeout=60*15)
+    def cache_get_role(slug):
+        return Role.objects.get(slug=slug)
+
+    @cached_as(Group, timeout=60*15)
+    def cache_get_group(slug):
+        return Group.objects.get(slug=slug)
 else:
+    from .models import Group, Role
     from .utils import check, any_action_check, any_permission_check
 
     def cache_check(user, scope, actions, role = None, **context):
@@ -31,3 +40,9 @@ else:
     
     def cache_any_permission_check(user, *str_perms):
         return any_permission_check(user, *str_perms)
+
+    def cache_get_role(slug):
+        return Role.objects.get(slug=slug)
+
+    def cache_get_group(slug):
+        return Group.objects.get(slug=slug)
@@ -6,7 +6,7 @@ from django.http import HttpRequest
 from ninja_extra.controllers import ControllerBase
 from ninja_extra.permissions import BasePermission
 
-from oxutils.permissions.utils import str_check
+from oxutils.permissions.utils import parse_permission
 
 
 class ScopePermission(BasePermission):
@@ -34,6 +34,9 @@ class ScopePermission(BasePermission):
         """
         self.perm = perm
         self.ctx = ctx if ctx else dict()
+        # Parsed once here rather than on every request
+        self._scope, self._actions, self._role, query_context = parse_permission(perm)
+        self._context = {**query_context, **self.ctx}
 
     def has_permission(self, request: HttpRequest, controller: ControllerBase) -> bool:
         """
@@ -46,7 +49,9 @@ class ScopePermission(BasePermission):
         Returns:
             True if user has permission, False otherwise
         """
-        return str_check(request.user, self.perm, **self.ctx)
+        from oxutils.permissions.caches import cache_check
+
+        return cache_check(request.user, self._scope, self._actions, role=self._role, **self._context)
 
 
 class ScopeAnyPermission(BasePermission):
@@ -129,6 +134,9 @@ class ScopeAnyActionPermission(BasePermission):
 
         self.perm = perm
         self.ctx = ctx if ctx else {}
+        # Parsed once here rather than on every request
+        self._scope, self._actions, self._role, query_context = parse_permission(perm)
+        self._context = {**query_context, **self.ctx}
 
     def has_permission(self, request: HttpRequest, controller: ControllerBase) -> bool:
         """
@@ -142,12 +150,10 @@ class ScopeAnyActionPermission(BasePermission):
             True if user has at least one action, False otherwise
         """
         from oxutils.permissions.caches import cache_any_action_check
-        from oxutils.permissions.utils import parse_permission
-
-        scope, actions, role, query_context = parse_permission(self.perm)
-        final_context = {**query_context, **self.ctx}
 
-        return cache_any_action_check(request.user, scope, actions, role=role, **final_context)
+        return cache_any_action_check(
+            request.user, self._scope, self._actions, role=self._role, **self._context
+        )
 
 
 def access_manager(actions: str):
@@ -1,4 +1,7 @@
+import re
+from functools import lru_cache
 from typing import Any, Optional
+from urllib.parse import parse_qs
 
 from django.contrib.auth.models import AbstractBaseUser
 from django.db import transaction
@@ -13,6 +16,13 @@ from .exceptions import (
 )
 from .models import Grant, Group, Role, RoleGrant, UserGroup
 
+# "<scope>:<actions>[:<role>][?<query>]", compilé une seule fois au chargement.
+# Tout ce qui suit un troisième ':' (avant le '?') est ignoré.
+_PERMISSION_RE = re.compile(
+    r"(?P<scope>[^:?]*):(?P<actions>[^:?]*)(?::(?P<role>[^:?]*))?[^?]*(?:\?(?P<query>.*))?",
+    re.DOTALL,
+)
+
 
 @transaction.atomic
 def assign_role(
@@ -36,26 +46,65 @@ def assign_role(
     Raises:
         RoleNotFoundException: Si le rôle n'existe pas
     """
+    from .caches import cache_get_role
+
     try:
-        role_obj = Role.objects.get(slug=role)
+        role_obj = cache_get_role(role)
     except Role.DoesNotExist as exc:
         raise RoleNotFoundException(detail=f"Le rôle '{role}' n'existe pas") from exc
 
     # Récupérer tous les RoleGrants pour ce rôle
-    role_grants = RoleGrant.objects.filter(role__slug=role, scope=scope)
+    role_grants = RoleGrant.objects.filter(role=role_obj, scope=scope)
 
-    for rg in role_grants:
-        Grant.objects.update_or_create(
-            user=user,
-            scope=rg.scope,
-            role=role_obj,
-            defaults={
-                "actions": expand_actions(rg.actions),
-                "context": rg.context,
-                "user_group": user_group,
-                "created_by": by,
-            },
+    _apply_role_grants(user, role_grants, by=by, user_group=user_group)
+
+
+def _apply_role_grants(
+    user: AbstractBaseUser,
+    role_grants,
+    *,
+    by: Optional[AbstractBaseUser] = None,
+    user_group: Optional[UserGroup] = None,
+) -> None:
+    role_grants = list(role_grants)
+    if not role_grants:
+        return
+
+    # Grants existants de l'utilisateur pour ces (scope, rôle), en une seule requête.
+    # role_id est le slug du rôle (clé primaire): pas besoin de charger le Role
+    existing = {
+        (grant.scope, grant.role_id): grant
+        for grant in Grant.objects.select_for_update().filter(
+            user__pk=user.pk,
+            scope__in={rg.scope for rg in role_grants},
+            role_id__in={rg.role_id for rg in role_grants},
         )
+    }
+
+    grants_to_create = []
+    for rg in role_grants:
+        values = {
+            "actions": expand_actions(rg.actions),
+            "context": rg.context,
+            "user_group": user_group,
+            "created_by": by,
+        }
+        grant = existing.get((rg.scope, rg.role_id))
+        if grant is None:
+            grants_to_create.append(
+                Grant(user=user, scope=rg.scope, role_id=rg.role_id, **values)
+            )
+            continue
+
+        # Mise à jour via save() pour conserver updated_at et l'invalidation du cache
+        for field, value in values.items():
+            setattr(grant, field, value)
+        grant.save(update_fields=[*values, "updated_at"])
+
+    # Créer les nouveaux grants en un seul INSERT; un grant créé entre-temps
+    # par une assignation concurrente est ignoré
+    if grants_to_create:
+        Grant.objects.bulk_create(grants_to_create, ignore_conflicts=True)
 
 
 def revoke_role(user: AbstractBaseUser, role: str, scope: str) -> tuple[int, dict[str, int]]:
@@ -73,8 +122,10 @@ def revoke_role(user: AbstractBaseUser, role: str, scope: str) -> tuple[int, dic
     Raises:
         RoleNotFoundException: Si le rôle n'existe pas
     """
+    from .caches import cache_get_role
+
     try:
-        role_obj = Role.objects.get(slug=role)
+        role_obj = cache_get_role(role)
     except Role.DoesNotExist as exc:
         raise RoleNotFoundException(detail=f"Le rôle '{role}' n'existe pas") from exc
 
@@ -100,25 +151,25 @@ def assign_group(
         GroupNotFoundException: Si le groupe n'existe pas
         GroupAlreadyAssignedException: Si le groupe est déjà assigné
     """
+    from .caches import cache_get_group
+
     if UserGroup.objects.filter(user=user, group__slug=group).exists():
         raise GroupAlreadyAssignedException(
             detail=f"Le groupe '{group}' est déjà assigné à l'utilisateur"
         )
 
     try:
-        _group: Group = Group.objects.get(slug=group)
+        _group: Group = cache_get_group(group)
     except Group.DoesNotExist as exc:
         raise GroupNotFoundException(detail=f"Le groupe '{group}' n'existe pas") from exc
 
     # Créer le UserGroup d'abord
     user_group, created = UserGroup.objects.get_or_create(user=user, group=_group)
 
-    # Assigner tous les rôles du groupe avec le lien vers UserGroup
-    for role in _group.roles.all():
-        # Récupérer tous les scopes pour ce rôle
-        scopes = RoleGrant.objects.filter(role=role).values_list("scope", flat=True).distinct()
-        for scope in scopes:
-            assign_role(user, role.slug, scope, by=by, user_group=user_group)
+    # Assigner tous les rôles du groupe avec le lien vers UserGroup,
+    # en récupérant les RoleGrants de tous ses rôles en une seule requête
+    role_grants = RoleGrant.objects.filter(role__groups=_group)
+    _apply_role_grants(user, role_grants, by=by, user_group=user_group)
 
     return user_group
 
@@ -140,8 +191,10 @@ def revoke_group(user: AbstractBaseUser, group: str) -> tuple[int, dict[str, int
         GroupNotFoundException: Si le groupe n'existe pas
         GroupNotFoundException: Si le groupe n'est pas assigné à l'utilisateur
     """
+    from .caches import cache_get_group
+
     try:
-        _group: Group = Group.objects.get(slug=group)
+        _group: Group = cache_get_group(group)
     except Group.DoesNotExist as exc:
         raise GroupNotFoundException(detail=f"Le groupe '{group}' n'existe pas") from exc
 
@@ -260,18 +313,22 @@ def group_sync(
     except Group.DoesNotExist as exc:
         raise GroupNotFoundException(detail=f"Le groupe '{group_slug}' n'existe pas") from exc
 
+    # Rôles du groupe, déjà chargés par prefetch_related
+    group_roles = list(group.roles.all())
+
     # Si des rôles spécifiques sont demandés, vérifier qu'ils existent et appartiennent au groupe
     if role_slugs:
-        group_role_slugs = set(group.roles.values_list("slug", flat=True))
+        group_role_slugs = {role.slug for role in group_roles}
+        existing_slugs = set(
+            Role.objects.filter(slug__in=role_slugs).values_list("slug", flat=True)
+        )
         for role_slug in role_slugs:
-            try:
-                Role.objects.get(slug=role_slug)
-                if role_slug not in group_role_slugs:
-                    raise RoleNotFoundException(
-                        detail=f"Le rôle '{role_slug}' n'appartient pas au groupe '{group_slug}'"
-                    )
-            except Role.DoesNotExist as exc:
-                raise RoleNotFoundException(detail=f"Le rôle '{role_slug}' n'existe pas") from exc
+            if role_slug not in existing_slugs:
+                raise RoleNotFoundException(detail=f"Le rôle '{role_slug}' n'existe pas")
+            if role_slug not in group_role_slugs:
+                raise RoleNotFoundException(
+                    detail=f"Le rôle '{role_slug}' n'appartient pas au groupe '{group_slug}'"
+                )
 
     # Construire une subquery pour identifier les grants verrouillés
     # Ces grants doivent être exclus de la synchronisation
@@ -304,7 +361,9 @@ def group_sync(
     grants_to_create = []
 
     # Réassigner tous les rôles du groupe (ou uniquement les rôles spécifiés)
-    roles_to_sync = group.roles.filter(slug__in=role_slugs) if role_slugs else group.roles.all()
+    roles_to_sync = (
+        [role for role in group_roles if role.slug in role_slugs] if role_slugs else group_roles
+    )
 
     # Récupérer tous les RoleGrants pour tous les rôles en une seule requête
     role_grants_query = RoleGrant.objects.filter(role__in=roles_to_sync)
@@ -314,16 +373,17 @@ def group_sync(
         role_grants_query = role_grants_query.filter(scope=scope)
 
     # Récupérer tous les UserGroups pour ce groupe
-    user_groups = UserGroup.objects.filter(group=group).select_related("user")
+    user_groups = UserGroup.objects.filter(group=group)
 
-    # Préparer les grants correspondants, en excluant les grants verrouillés via subquery
+    # Préparer les grants correspondants, en excluant les grants verrouillés via subquery.
+    # On passe par user_id / role_id pour ne charger ni les User ni les Role
     for user_group in user_groups:
         for rg in role_grants_query:
             grants_to_create.append(
                 Grant(
-                    user=user_group.user,
+                    user_id=user_group.user_id,
                     scope=rg.scope,
-                    role=rg.role,
+                    role_id=rg.role_id,
                     actions=expand_actions(rg.actions),
                     context=rg.context,
                     user_group=user_group,
@@ -342,7 +402,7 @@ def group_sync(
         filtered_grants = [
             grant
             for grant in grants_to_create
-            if (grant.user.id, grant.scope, grant.role.pk) not in locked_set
+            if (grant.user_id, grant.scope, grant.role_id) not in locked_set
         ]
 
         if filtered_grants:
@@ -388,8 +448,10 @@ def role_sync(role_slug: str, scope: Optional[str] = None) -> dict[str, int]:
         >>> role_sync("editor", scope="articles")
         {"grants_updated": 3}
     """
+    from .caches import cache_get_role
+
     try:
-        role = Role.objects.get(slug=role_slug)
+        role = cache_get_role(role_slug)
     except Role.DoesNotExist as exc:
         raise RoleNotFoundException(detail=f"Le rôle '{role_slug}' n'existe pas") from exc
 
@@ -669,42 +731,33 @@ def parse_permission(perm: str) -> tuple[str, list[str], Optional[str], dict[str
         >>> parse_permission('articles:w:editor?tenant_id=123')
         ('articles', ['w'], 'editor', {'tenant_id': 123})
     """
-    # Séparer la partie principale des query params
-    if "?" in perm:
-        from urllib.parse import parse_qs
-
-        main_part, query_string = perm.split("?", 1)
-        # Parser les query params
-        parsed_qs = parse_qs(query_string)
-        # Convertir en dict simple (prendre la première valeur de chaque liste)
-        query_context = {k: v[0] if len(v) == 1 else v for k, v in parsed_qs.items()}
-        # Convertir les valeurs numériques
-        for k, v in query_context.items():
-            if isinstance(v, str) and v.isdigit():
-                query_context[k] = int(v)
-    else:
-        main_part = perm
-        query_context = {}
-
-    # Parser la partie principale
-    parts = main_part.split(":")
-
-    if len(parts) < 2:
+    scope, actions, role, query_context = _parse_permission(perm)
+    # Copier: le résultat mémoïsé est partagé entre les appelants
+    query_context = {k: list(v) if isinstance(v, list) else v for k, v in query_context.items()}
+    return scope, list(actions), role, query_context
+
+
+@lru_cache(maxsize=1024)
+def _parse_permission(perm: str) -> tuple[str, tuple[str, ...], Optional[str], dict[str, Any]]:
+    match = _PERMISSION_RE.fullmatch(perm)
+    if match is None:
         raise ValueError(
             f"Format de permission invalide: '{perm}'. "
             "Format attendu: '<scope>:<actions>' ou '<scope>:<actions>:<role>' "
             "ou '<scope>:<actions>:<role>?key=value&key2=value2'"
         )
 
-    scope = parts[0]
-    actions_str = parts[1]
-    role = parts[2] if len(parts) > 2 else None
-
-    # Convertir la chaîne d'actions en liste
-    # 'rwd' -> ['r', 'w', 'd']
-    actions_list = list(actions_str)
-
-    return scope, actions_list, role, query_context
+    query_context = {}
+    if match['query']:
+        # Prendre la première valeur de chaque liste et convertir les valeurs numériques
+        for k, v in parse_qs(match['query']).items():
+            value = v[0] if len(v) == 1 else v
+            if isinstance(value, str) and value.isdigit():
+                value = int(value)
+            query_context[k] = value
+
+    # 'rwd' -> ('r', 'w', 'd')
+    return match['scope'], tuple(match['actions']), match['role'], query_context
 
 
 def str_check(user: AbstractBaseUser, perm: str, **context: Any) -> bool:
@@ -2,24 +2,41 @@
 Tests for context processors
 """
 
-from unittest.mock import Mock, patch
+from dataclasses import dataclass
+from typing import Optional
+
+import pytest
 
 from oxutils.context.site_name_processor import site_name
 
 
+@dataclass(slots=True)
+class _OxiSettingsStub:
+    """The oxi_settings fields read by the site_name processor."""
+
+    site_name: Optional[str] = None
+    site_domain: Optional[str] = None
+
+
+@pytest.fixture
+def oxi_settings(monkeypatch):
+    """Replace oxutils.settings.oxi_settings with a plain stub."""
+    stub = _OxiSettingsStub()
+    monkeypatch.setattr("oxutils.settings.oxi_settings", stub)
+    return stub
+
+
 class TestSiteNameProcessor:
     """Tests for site_name context processor"""
 
-    @patch("oxutils.settings.oxi_settings")
-    def test_site_name_processor_returns_correct_context(self, mock_settings):
+    def test_site_name_processor_returns_correct_context(self, oxi_settings, request_factory):
         """Test that site_name processor returns site_name and site_domain"""
         # Arrange
-        mock_settings.site_name = "Test Site"
-        mock_settings.site_domain = "test.example.com"
-        mock_request = Mock()
+        oxi_settings.site_name = "Test Site"
+        oxi_settings.site_domain = "test.example.com"
 
         # Act
-        result = site_name(mock_request)
+        result = site_name(request_factory.get("/"))
 
         # Assert
         assert "site_name" in result
@@ -27,42 +44,33 @@ class TestSiteNameProcessor:
         assert result["site_name"] == "Test Site"
         assert result["site_domain"] == "test.example.com"
 
-    @patch("oxutils.settings.oxi_settings")
-    def test_site_name_processor_with_empty_values(self, mock_settings):
+    def test_site_name_processor_with_empty_values(self, oxi_settings, request_factory):
         """Test site_name processor with empty values"""
         # Arrange
-        mock_settings.site_name = ""
-        mock_settings.site_domain = ""
-        mock_request = Mock()
+        oxi_settings.site_name = ""
+        oxi_settings.site_domain = ""
 
         # Act
-        result = site_name(mock_request)
+        result = site_name(request_factory.get("/"))
 
         # Assert
         assert result["site_name"] == ""
         assert result["site_domain"] == ""
 
-    @patch("oxutils.settings.oxi_settings")
-    def test_site_name_processor_with_none_values(self, mock_settings):
+    def test_site_name_processor_with_none_values(self, oxi_settings, request_factory):
         """Test site_name processor with None values"""
-        # Arrange
-        mock_settings.site_name = None
-        mock_settings.site_domain = None
-        mock_request = Mock()
-
         # Act
-        result = site_name(mock_request)
+        result = site_name(request_factory.get("/"))
 
         # Assert
         assert result["site_name"] is None
         assert result["site_domain"] is None
 
-    @patch("oxutils.settings.oxi_settings")
-    def test_site_name_processor_request_not_used(self, mock_settings):
+    def test_site_name_processor_request_not_used(self, oxi_settings):
         """Test that the request parameter is not used in the processor"""
         # Arrange
-        mock_settings.site_name = "Site"
-        mock_settings.site_domain = "domain.com"
+        oxi_settings.site_name = "Site"
+        oxi_settings.site_domain = "domain.com"
 
         # Act - pass None as request since it's not used
         result = site_name(None)
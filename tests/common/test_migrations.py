@@ -0,0 +1,22 @@
+"""
+Tests for the oxutils migrations.
+"""
+
+import pytest
+from django.apps import apps
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+def test_migrations_match_models(settings):
+    """Test every oxutils app has migrations for its current models.
+
+    The suite runs with --nomigrations, so this is what catches a model
+    change committed without its migration.
+    """
+    # --nomigrations disables every app's migrations through MIGRATION_MODULES
+    settings.MIGRATION_MODULES = {}
+    labels = [app.label for app in apps.get_app_configs() if app.name.startswith("oxutils")]
+
+    # Exits with status 1 when a migration is missing
+    call_command("makemigrations", *labels, check=True, dry_run=True, verbosity=0)
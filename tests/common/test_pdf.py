@@ -3,12 +3,24 @@ Tests for PDF generation module.
 """
 
 import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 from django.test import RequestFactory, TestCase, override_settings
 
 
+def _mock_document(mock_html, pdf_bytes=b"PDF_CONTENT"):
+    """Make a patched weasyprint.HTML render a document whose write_pdf returns ``pdf_bytes``."""
+    mock_document = mock_html.return_value.render.return_value
+    mock_document.write_pdf.return_value = pdf_bytes
+    return mock_document
+
+
 @pytest.mark.django_db
 class TestPrinter(TestCase):
     """Tests for the Printer class."""
@@ -24,6 +36,24 @@ class TestPrinter(TestCase):
         """
         self.context = {"title": "Test Document", "content": "This is test content."}
 
+        font_config_patch = patch("oxutils.pdf.printer._FONT_CONFIGS", threading.local())
+        font_config_patch.start()
+        self.addCleanup(font_config_patch.stop)
+
+        from oxutils.pdf.printer import _parse_css, _render_cached
+
+        _parse_css.cache_clear()
+        _render_cached.cache_clear()
+
+    def _stylesheet_files(self, *names):
+        """Create empty stylesheets in a temporary directory and return their paths."""
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        paths = [os.path.join(directory.name, name) for name in names]
+        for path in paths:
+            open(path, "w").close()  # noqa: PTH123
+        return paths
+
     @patch("oxutils.pdf.printer.render_to_string")
     @patch("oxutils.pdf.printer.weasyprint.HTML")
     def test_printer_initialization(self, mock_html, mock_render):
@@ -41,7 +71,7 @@ class TestPrinter(TestCase):
         assert printer.template_name == "test.html"
         assert printer.context == {"key": "value"}
         assert printer._stylesheets == ["style.css"]
-        assert printer._options == {"pdf_forms": True}
+        assert printer._options == {"pdf_forms": True, "cache": {}}
         assert printer._base_url == "http://example.com"
 
     @patch("oxutils.pdf.printer.render_to_string")
@@ -58,6 +88,125 @@ class TestPrinter(TestCase):
         mock_render.assert_called_once_with("test.html", {"title": "Test"})
         assert html == "<html><body>Test</body></html>"
 
+    @patch("oxutils.pdf.printer.render_to_string")
+    def test_render_html_cached(self, mock_render):
+        """Test identical template/context renders are served from cache."""
+        from oxutils.pdf.printer import Printer
+
+        mock_render.return_value = "<html><body>Test</body></html>"
+
+        context = {"title": "Test", "lines": [{"qty": 1}, {"qty": 2}]}
+        first = Printer(template_name="test.html", context=context, cache_template=True).render_html()
+        second = Printer(template_name="test.html", context=context, cache_template=True).render_html()
+
+        assert mock_render.call_count == 1
+        assert first == second
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    def test_render_html_cache_key_ignores_dict_order(self, mock_render):
+        """Test contexts equal up to key order share one cached render."""
+        from oxutils.pdf.printer import Printer
+
+        mock_render.return_value = "<html><body>Test</body></html>"
+
+        first = {"title": "Test", "customer": {"name": "A", "vat": "BE1"}}
+        second = {"customer": {"vat": "BE1", "name": "A"}, "title": "Test"}
+        Printer(template_name="test.html", context=first, cache_template=True).render_html()
+        Printer(template_name="test.html", context=second, cache_template=True).render_html()
+
+        assert mock_render.call_count == 1
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    def test_render_html_cache_disabled(self, mock_render):
+        """Test the template is rendered every time unless cache_template is set."""
+        from oxutils.pdf.printer import Printer
+
+        printer = Printer(template_name="test.html", context={"title": "Test"})
+        printer.render_html()
+        printer.render_html()
+
+        assert mock_render.call_count == 2
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    def test_render_html_not_cached_for_objects(self, mock_render):
+        """Test contexts holding arbitrary objects bypass the cache."""
+        from oxutils.pdf.printer import Printer
+
+        printer = Printer(template_name="test.html", context={"invoice": object()}, cache_template=True)
+        printer.render_html()
+        printer.render_html()
+
+        assert mock_render.call_count == 2
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.HTML")
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    def test_strip_link_removes_bundle_css(self, mock_font_config, mock_html, mock_render):
+        """Test configured link patterns are stripped before WeasyPrint sees the HTML."""
+        from oxutils.pdf.printer import SCREEN_ONLY_LINK_RE, Printer
+
+        mock_render.return_value = (
+            '<html><head><link rel="stylesheet" href="/static/foo.bundle.css">'
+            '<link rel="stylesheet" href="/static/print.css"></head><body>Test</body></html>'
+        )
+
+        class BundleFreePrinter(Printer):
+            strip_link_patterns = (SCREEN_ONLY_LINK_RE,)
+
+        BundleFreePrinter(template_name="test.html").get_document()
+
+        html_string = mock_html.call_args.kwargs["string"]
+        assert "foo.bundle.css" not in html_string
+        assert "print.css" in html_string
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.HTML")
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    @patch("oxutils.pdf.printer.prefetch_urls")
+    def test_prefetch_asset_urls(self, mock_prefetch, mock_font_config, mock_html, mock_render):
+        """Test prefetch=True warms image and stylesheet URLs, not hyperlinks."""
+        from oxutils.pdf.printer import Printer
+
+        mock_render.return_value = (
+            '<link rel="stylesheet" href="/static/css/print.css">'
+            '<img src="/media/logo.png"><a href="https://example.com/">site</a>'
+        )
+
+        printer = Printer(template_name="test.html", base_url="file:///", prefetch=True)
+        printer.get_document()
+
+        mock_prefetch.assert_called_once_with(
+            ["file:///static/css/print.css", "file:///media/logo.png"],
+            printer.get_url_fetcher(),
+        )
+        assert mock_html.call_args.kwargs["url_fetcher"] is mock_prefetch.return_value
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.HTML")
+    @patch("oxutils.pdf.printer.weasyprint.CSS")
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    @patch("oxutils.pdf.printer.prefetch_urls")
+    def test_prefetch_keeps_css_cache(self, mock_prefetch, mock_font_config, mock_css, mock_html, mock_render):
+        """Test stylesheets are parsed with the base fetcher, so prefetching keeps them cached."""
+        from oxutils.pdf.printer import Printer
+
+        mock_render.return_value = '<img src="/media/logo.png">'
+        mock_prefetch.side_effect = lambda urls, url_fetcher: MagicMock()
+        stylesheets = self._stylesheet_files("print.css")
+
+        for _ in range(2):
+            printer = Printer(
+                template_name="test.html",
+                stylesheets=stylesheets,
+                base_url="file:///",
+                prefetch=True,
+            )
+            printer.get_document()
+
+        assert mock_prefetch.call_count == 2
+        assert mock_css.call_count == 1
+        assert mock_css.call_args.kwargs["url_fetcher"] is printer.get_url_fetcher()
+
     @patch("oxutils.pdf.printer.render_to_string")
     def test_get_context_data(self, mock_render):
         """Test context data merging."""
@@ -77,18 +226,47 @@ class TestPrinter(TestCase):
         from oxutils.pdf.printer import Printer
 
         mock_render.return_value = "<html><body>Test</body></html>"
-        mock_html_instance = MagicMock()
-        mock_html.return_value = mock_html_instance
-        mock_document = MagicMock()
-        mock_html_instance.render.return_value = mock_document
+        mock_document = _mock_document(mock_html)
 
         printer = Printer(template_name="test.html")
         document = printer.get_document()
 
         mock_html.assert_called_once()
-        mock_html_instance.render.assert_called_once()
+        mock_html.return_value.render.assert_called_once()
         assert document == mock_document
 
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.HTML")
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    def test_font_configuration_is_cached(self, mock_font_config, mock_html, mock_render):
+        """Test FontConfiguration is built once and shared across documents."""
+        from oxutils.pdf.printer import Printer
+
+        mock_render.return_value = "<html><body>Test</body></html>"
+
+        Printer(template_name="test.html").get_document()
+        Printer(template_name="test.html").get_document()
+
+        assert mock_font_config.call_count == 1
+
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    def test_font_configuration_is_per_thread(self, mock_font_config):
+        """Test each thread gets its own FontConfiguration."""
+        from oxutils.pdf.printer import Printer
+
+        mock_font_config.side_effect = lambda: MagicMock()
+
+        font_configs = []
+        thread = threading.Thread(
+            target=lambda: font_configs.append(Printer(template_name="test.html").get_font_config())
+        )
+        thread.start()
+        thread.join()
+        font_configs.append(Printer(template_name="test.html").get_font_config())
+
+        assert font_configs[0] is not font_configs[1]
+        assert mock_font_config.call_count == 2
+
     @patch("oxutils.pdf.printer.render_to_string")
     @patch("oxutils.pdf.printer.weasyprint.HTML")
     @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
@@ -97,11 +275,7 @@ class TestPrinter(TestCase):
         from oxutils.pdf.printer import Printer
 
         mock_render.return_value = "<html><body>Test</body></html>"
-        mock_html_instance = MagicMock()
-        mock_html.return_value = mock_html_instance
-        mock_document = MagicMock()
-        mock_document.write_pdf.return_value = b"PDF_CONTENT"
-        mock_html_instance.render.return_value = mock_document
+        mock_document = _mock_document(mock_html)
 
         printer = Printer(template_name="test.html")
         pdf_bytes = printer.write_pdf()
@@ -117,11 +291,7 @@ class TestPrinter(TestCase):
         from oxutils.pdf.printer import Printer
 
         mock_render.return_value = "<html><body>Test</body></html>"
-        mock_html_instance = MagicMock()
-        mock_html.return_value = mock_html_instance
-        mock_document = MagicMock()
-        mock_document.write_pdf.return_value = b"PDF_CONTENT"
-        mock_html_instance.render.return_value = mock_document
+        mock_document = _mock_document(mock_html)
 
         printer = Printer(template_name="test.html")
 
@@ -129,7 +299,71 @@ class TestPrinter(TestCase):
         result = printer.write_pdf(output=output)
 
         mock_document.write_pdf.assert_called_once()
-        assert result == b"PDF_CONTENT"
+        assert mock_document.write_pdf.call_args.kwargs["target"] is output
+        assert result is output
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.HTML")
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    def test_image_cache_scoped_to_printer(self, mock_font_config, mock_html, mock_render):
+        """Test a printer reuses its image cache across renders but never shares it."""
+        from oxutils.pdf.printer import Printer
+
+        mock_render.return_value = "<html><body>Test</body></html>"
+        _mock_document(mock_html)
+
+        def render_cache():
+            return mock_html.return_value.render.call_args.kwargs["cache"]
+
+        printer = Printer(template_name="test.html")
+        printer.write_pdf(title="First")
+        first = render_cache()
+        printer.write_pdf(title="Second")
+        assert render_cache() is first
+
+        Printer(template_name="test.html").write_pdf()
+        assert render_cache() is not first
+
+        Printer(template_name="test.html", options={"cache": None}).write_pdf()
+        assert render_cache() is None
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.HTML")
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    def test_rendered_document_is_cached(self, mock_font_config, mock_html, mock_render):
+        """Test repeated writes share one layout pass unless extra context is given."""
+        from oxutils.pdf.printer import Printer
+
+        mock_render.return_value = "<html><body>Test</body></html>"
+        _mock_document(mock_html)
+
+        printer = Printer(template_name="test.html")
+        printer.write_pdf()
+        printer.write_pdf(output=io.BytesIO())
+
+        assert mock_html.return_value.render.call_count == 1
+
+        printer.write_pdf(title="Other")
+
+        assert mock_html.return_value.render.call_count == 2
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.HTML")
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    def test_rendered_document_reset_on_new_context(self, mock_font_config, mock_html, mock_render):
+        """Test assigning a new context lays the document out again."""
+        from oxutils.pdf.printer import Printer
+
+        mock_render.side_effect = lambda name, context: f"<p>{context['title']}</p>"
+        _mock_document(mock_html)
+
+        printer = Printer(template_name="test.html", context={"title": "First"})
+        printer.write_pdf()
+        printer.context = {"title": "Second"}
+        printer.write_pdf()
+
+        assert mock_html.return_value.render.call_count == 2
+        assert mock_html.call_args.kwargs["string"] == "<p>Second</p>"
 
     @patch("oxutils.pdf.printer.render_to_string")
     @patch("oxutils.pdf.printer.weasyprint.HTML")
@@ -139,18 +373,36 @@ class TestPrinter(TestCase):
         from oxutils.pdf.printer import Printer
 
         mock_render.return_value = "<html><body>Test</body></html>"
-        mock_html_instance = MagicMock()
-        mock_html.return_value = mock_html_instance
-        mock_document = MagicMock()
-        mock_document.write_pdf.return_value = b"PDF_CONTENT"
-        mock_html_instance.render.return_value = mock_document
+        _mock_document(mock_html)
 
         printer = Printer(template_name="test.html")
 
         file_obj = io.BytesIO()
         result = printer.write_object(file_obj)
 
-        assert result == b"PDF_CONTENT"
+        assert result is file_obj
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.HTML")
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    def test_buffer_pool_reuses_instance(self, mock_font_config, mock_html, mock_render):
+        """Test pooled buffers hold the PDF and are reused once released."""
+        from oxutils.pdf.printer import Printer
+
+        mock_render.return_value = "<html><body>Test</body></html>"
+        mock_document = MagicMock()
+        mock_document.write_pdf.side_effect = lambda target=None, **kwargs: target.write(b"PDF")
+        mock_html.return_value.render.return_value = mock_document
+
+        printer = Printer(template_name="test.html")
+
+        with printer.write_pdf_to_pooled_buffer() as first:
+            assert first.read() == b"PDF"
+        with printer.write_pdf_to_pooled_buffer() as second:
+            assert second.getvalue() == b"PDF"
+
+        assert id(first) == id(second)
+        assert second.getvalue() == b""
 
     @override_settings(WEASYPRINT_BASEURL="http://test.com/")
     @patch("oxutils.pdf.printer.render_to_string")
@@ -188,6 +440,142 @@ class TestPrinter(TestCase):
         assert len(css_list) == 2
         assert mock_css.call_count == 2
 
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.CSS")
+    def test_get_css_is_cached(self, mock_css, mock_render):
+        """Test identical stylesheets are parsed only once."""
+        from oxutils.pdf.printer import Printer
+
+        stylesheets = self._stylesheet_files("style1.css", "style2.css")
+        printer = Printer(template_name="test.html", stylesheets=stylesheets)
+
+        mock_font = MagicMock()
+        fetcher = lambda x: x  # noqa: E731
+        first = printer.get_css("http://base.com", fetcher, mock_font)
+        assert mock_css.call_count == 2
+
+        second = printer.get_css("http://base.com", fetcher, mock_font)
+        assert mock_css.call_count == 2
+        assert first == second
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.CSS")
+    def test_get_css_not_cached_without_mtime(self, mock_css, mock_render):
+        """Test URL stylesheets, which have no mtime, are parsed on every call."""
+        from oxutils.pdf.printer import Printer
+
+        printer = Printer(template_name="test.html", stylesheets=["https://cdn.example.com/print.css"])
+
+        mock_font = MagicMock()
+        fetcher = lambda x: x  # noqa: E731
+        printer.get_css("http://base.com", fetcher, mock_font)
+        printer.get_css("http://base.com", fetcher, mock_font)
+
+        assert mock_css.call_count == 2
+
+
+@pytest.mark.django_db
+class TestPDFBatch(TestCase):
+    """Tests for Printer.write_pdfs_batch."""
+
+    def setUp(self):
+        """Reset the shared font configuration."""
+        font_config_patch = patch("oxutils.pdf.printer._FONT_CONFIGS", threading.local())
+        font_config_patch.start()
+        self.addCleanup(font_config_patch.stop)
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.HTML")
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    def test_batch_single_render_call(self, mock_font_config, mock_html, mock_render):
+        """Test a batch is laid out once and split per context."""
+        from oxutils.pdf.printer import Printer
+
+        mock_render.side_effect = lambda name, context: f"<p>{context['number']}</p>"
+        mock_document = _mock_document(mock_html)
+        # Context 1 spans two pages, the others one page each.
+        page_anchors = [
+            ["oxutils-batch-0"],
+            ["oxutils-batch-1"],
+            [],
+            ["oxutils-batch-2"],
+            ["oxutils-batch-3"],
+            ["oxutils-batch-4"],
+        ]
+        mock_document.pages = [
+            MagicMock(anchors=dict.fromkeys(anchors, (0, 0))) for anchors in page_anchors
+        ]
+        mock_document.copy.side_effect = lambda pages: MagicMock(
+            write_pdf=MagicMock(return_value=f"PDF:{len(pages)}".encode())
+        )
+
+        printer = Printer(template_name="invoice.html")
+        result = printer.write_pdfs_batch([{"number": n} for n in range(5)])
+
+        assert mock_html.call_count == 1
+        assert mock_html.return_value.render.call_count == 1
+        assert len(result) == 5
+        assert result == [b"PDF:1", b"PDF:2", b"PDF:1", b"PDF:1", b"PDF:1"]
+        html_string = mock_html.call_args.kwargs["string"]
+        assert html_string.count("break-before: page") == 4
+        # Contexts after the two-page one start on later pages of the layout.
+        pages = mock_document.pages
+        assert [c.args[0] for c in mock_document.copy.call_args_list] == [
+            pages[0:1], pages[1:3], pages[3:4], pages[4:5], pages[5:6],
+        ]
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.HTML")
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    def test_batch_page_counters_laid_out_per_context(self, mock_font_config, mock_html, mock_render):
+        """Test templates numbering pages get one layout per context, so numbers restart."""
+        from oxutils.pdf.printer import Printer
+
+        mock_render.side_effect = lambda name, context: (
+            '<style>@page { @bottom-right { content: counter(page) " / " counter(pages) } }</style>'
+            f"<p>{context['number']}</p>"
+        )
+        mock_html.side_effect = lambda **kwargs: MagicMock(
+            render=MagicMock(return_value=MagicMock(
+                write_pdf=MagicMock(return_value=kwargs["string"].encode())
+            ))
+        )
+
+        printer = Printer(template_name="invoice.html")
+        result = printer.write_pdfs_batch([{"number": n} for n in range(3)])
+
+        assert mock_html.call_count == 3
+        assert [pdf.endswith(f"<p>{n}</p>".encode()) for n, pdf in enumerate(result)] == [True] * 3
+        assert all(b"oxutils-batch-" not in pdf for pdf in result)
+
+    @patch("oxutils.pdf.printer.render_to_string")
+    @patch("oxutils.pdf.printer.weasyprint.CSS")
+    @patch("oxutils.pdf.printer.weasyprint.HTML")
+    @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
+    def test_batch_first_page_stylesheet_laid_out_per_context(self, mock_font_config, mock_html, mock_css, mock_render):
+        """Test a local stylesheet with an @page :first rule also disables the shared layout."""
+        from oxutils.pdf.printer import Printer
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        stylesheet = os.path.join(directory.name, "invoice.css")
+        with open(stylesheet, "w") as f:  # noqa: PTH123
+            f.write("@page :first { margin-top: 5cm }")
+        mock_render.side_effect = lambda name, context: f"<p>{context['number']}</p>"
+        _mock_document(mock_html)
+
+        printer = Printer(template_name="invoice.html", stylesheets=[stylesheet])
+        assert len(printer.write_pdfs_batch([{"number": n} for n in range(2)])) == 2
+
+        assert mock_html.call_count == 2
+        mock_html.return_value.render.return_value.copy.assert_not_called()
+
+    def test_batch_empty(self):
+        """Test an empty batch renders nothing."""
+        from oxutils.pdf.printer import Printer
+
+        assert Printer(template_name="invoice.html").write_pdfs_batch([]) == []
+
 
 @pytest.mark.django_db
 class TestWeasyTemplateView(TestCase):
@@ -195,7 +583,14 @@ class TestWeasyTemplateView(TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
+        from oxutils.pdf.views import _content_disposition
+
         self.factory = RequestFactory()
+        _content_disposition.cache_clear()
+
+        font_config_patch = patch("oxutils.pdf.printer._FONT_CONFIGS", threading.local())
+        font_config_patch.start()
+        self.addCleanup(font_config_patch.stop)
 
     @patch("oxutils.pdf.views.weasyprint.HTML")
     @patch("oxutils.pdf.views.weasyprint.text.fonts.FontConfiguration")
@@ -203,11 +598,7 @@ class TestWeasyTemplateView(TestCase):
         """Test WeasyTemplateView GET request."""
         from oxutils.pdf.views import WeasyTemplateView
 
-        mock_html_instance = MagicMock()
-        mock_html.return_value = mock_html_instance
-        mock_document = MagicMock()
-        mock_document.write_pdf.return_value = b"PDF_CONTENT"
-        mock_html_instance.render.return_value = mock_document
+        _mock_document(mock_html)
 
         class TestPDFView(WeasyTemplateView):
             template_name = "test.html"
@@ -226,6 +617,51 @@ class TestWeasyTemplateView(TestCase):
         assert response["Content-Type"] == "application/pdf"
         assert "test.pdf" in response["Content-Disposition"]
 
+    @patch("oxutils.pdf.views.weasyprint.text.fonts.FontConfiguration")
+    def test_font_configuration_shared_within_thread(self, mock_font_config):
+        """Test responses reuse their thread's FontConfiguration, not another thread's."""
+        from oxutils.pdf.views import WeasyTemplateResponse
+
+        mock_font_config.side_effect = lambda: MagicMock()
+
+        def font_config():
+            return WeasyTemplateResponse(self.factory.get("/test/"), "test.html").get_font_config()
+
+        font_configs = [font_config(), font_config()]
+        thread = threading.Thread(target=lambda: font_configs.append(font_config()))
+        thread.start()
+        thread.join()
+
+        assert font_configs[0] is font_configs[1]
+        assert font_configs[2] is not font_configs[0]
+        assert mock_font_config.call_count == 2
+
+    @patch("oxutils.pdf.views.weasyprint.HTML")
+    @patch("oxutils.pdf.views.weasyprint.text.fonts.FontConfiguration")
+    def test_disposition_is_cached(self, mock_font_config, mock_html):
+        """Test the Content-Disposition value is built once per filename."""
+        from django.utils.http import content_disposition_header
+
+        from oxutils.pdf.views import WeasyTemplateView
+
+        _mock_document(mock_html)
+
+        class TestPDFView(WeasyTemplateView):
+            template_name = "test.html"
+            pdf_filename = "résumé.pdf"
+
+        view = TestPDFView.as_view()
+        with patch(
+            "oxutils.pdf.views.content_disposition_header",
+            wraps=content_disposition_header,
+        ) as mock_header:
+            first = view(self.factory.get("/test/"))
+            second = view(self.factory.get("/test/"))
+
+        assert mock_header.call_count == 1
+        assert first["Content-Disposition"] == second["Content-Disposition"]
+        assert first["Content-Disposition"] == "attachment; filename*=utf-8''r%C3%A9sum%C3%A9.pdf"
+
     def test_get_pdf_filename(self):
         """Test get_pdf_filename method."""
         from oxutils.pdf.views import WeasyTemplateView
@@ -265,11 +701,52 @@ class TestWeasyTemplateView(TestCase):
 
         assert options == {"pdf_forms": True, "uncompressed_pdf": False}
 
+    @patch("oxutils.pdf.views.weasyprint.HTML")
+    @patch("oxutils.pdf.views.weasyprint.text.fonts.FontConfiguration")
+    @patch("oxutils.pdf.views.TemplateResponse.rendered_content", "<html></html>")
+    def test_get_pdf_options_no_override_returns_class_attr(self, mock_font_config, mock_html):
+        """Test options flow to the response uncopied and are never mutated."""
+        from oxutils.pdf.views import WeasyTemplateView
+
+        _mock_document(mock_html)
+
+        class TestPDFView(WeasyTemplateView):
+            template_name = "test.html"
+            pdf_options = {"pdf_forms": True}
+
+        view = TestPDFView()
+        assert view.get_pdf_options() is TestPDFView.pdf_options
+
+        response = TestPDFView.as_view()(self.factory.get("/test/"))
+        response.render()
+
+        assert mock_html.return_value.render.call_args.kwargs["pdf_forms"] is True
+        assert "stylesheets" in mock_html.return_value.render.call_args.kwargs
+        assert TestPDFView.pdf_options == {"pdf_forms": True}
+
+    def test_get_pdf_options_is_mapping_proxy(self):
+        """Test default options are shared read-only, not copied per request."""
+        from oxutils.pdf.views import WeasyTemplateView
+
+        view = WeasyTemplateView()
+        options = view.get_pdf_options()
+
+        assert options is WeasyTemplateView.pdf_options
+        assert view.get_pdf_stylesheets() == ()
+        with pytest.raises(TypeError):
+            options["pdf_forms"] = True
+
 
 @pytest.mark.django_db
 class TestPDFUtils(TestCase):
     """Tests for PDF utility functions."""
 
+    def setUp(self):
+        """Reset cached STATIC_ROOT lookups."""
+        static_root_paths_patch = patch.dict("oxutils.pdf.utils._STATIC_ROOT_PATHS", clear=True)
+        static_root_paths_patch.start()
+        self.addCleanup(static_root_paths_patch.stop)
+
     @override_settings(DEBUG=True)
     @patch("oxutils.pdf.utils.find")
     def test_get_stylesheet_path_debug_mode(self, mock_find):
@@ -296,6 +773,41 @@ class TestPDFUtils(TestCase):
         assert path == "/var/www/static/css/style.css"
         mock_exists.assert_called_once_with("/var/www/static/css/style.css")
 
+    @override_settings(DEBUG=False, STATIC_ROOT="/var/www/static/")
+    @patch("oxutils.pdf.utils.os.path.exists")
+    def test_get_stylesheet_path_production_cached(self, mock_exists):
+        """Test production lookups hit the filesystem once per path."""
+        from oxutils.pdf.utils import get_stylesheet_path
+
+        mock_exists.return_value = True
+
+        first = get_stylesheet_path("css/style.css")
+        second = get_stylesheet_path("css/style.css")
+
+        assert first == second == "/var/www/static/css/style.css"
+        assert mock_exists.call_count == 1
+
+    @override_settings(DEBUG=False, STATIC_ROOT="/var/www/static/")
+    @patch("oxutils.pdf.utils.os.path.exists")
+    def test_get_stylesheet_path_production_miss_not_cached(self, mock_exists):
+        """Test a stylesheet collected after a failed lookup is found."""
+        from oxutils.pdf.utils import get_stylesheet_path
+
+        mock_exists.return_value = False
+        assert get_stylesheet_path("css/style.css") is None
+
+        mock_exists.return_value = True
+        assert get_stylesheet_path("css/style.css") == "/var/www/static/css/style.css"
+
+    @override_settings(DEBUG=False, STATIC_ROOT=None)
+    @patch("oxutils.pdf.utils.os.path.exists")
+    def test_get_stylesheet_path_without_static_root(self, mock_exists):
+        """Test an unset STATIC_ROOT resolves nothing instead of a "None" directory."""
+        from oxutils.pdf.utils import get_stylesheet_path
+
+        assert get_stylesheet_path("css/style.css") is None
+        mock_exists.assert_not_called()
+
     @override_settings(DEBUG=False, STATIC_ROOT="/var/www/static/")
     @patch("oxutils.pdf.utils.os.path.exists")
     def test_get_stylesheet_path_not_found(self, mock_exists):
@@ -322,9 +834,21 @@ class TestPDFUtils(TestCase):
 
         stylesheets = get_stylesheets("style1.css", "style2.css", "missing.css")
 
-        assert len(stylesheets) == 2
-        assert "/path/to/style1.css" in stylesheets
-        assert "/path/to/style2.css" in stylesheets
+        assert stylesheets == ["/path/to/style1.css", "/path/to/style2.css"]
+        assert mock_find.call_count == 3
+
+    @override_settings(DEBUG=True, STATIC_ROOT="/var/www/static/")
+    @patch("oxutils.pdf.utils.find")
+    def test_get_stylesheets_dedup(self, mock_find):
+        """Test repeated paths are resolved once, keeping their last position."""
+        from oxutils.pdf.utils import get_stylesheets
+
+        mock_find.side_effect = lambda path: f"/path/to/{path}"
+
+        stylesheets = get_stylesheets(*(["base.css", "print.css"] * 50), "base.css")
+
+        assert stylesheets == ["/path/to/print.css", "/path/to/base.css"]
+        assert mock_find.call_count == 2
 
     @override_settings(DEBUG=True, STATIC_ROOT="/var/www/static/")
     @patch("oxutils.pdf.utils.find")
@@ -357,6 +881,11 @@ class TestDjangoURLFetcher(TestCase):
         assert result["mime_type"] == "text/css"
         assert result["filename"] == "style.css"
         mock_find.assert_called_once()
+        # The open handle is handed to WeasyPrint, never read into memory here.
+        mock_file.assert_called_once_with("/path/to/static/css/style.css", "rb")
+        assert result["file_obj"] is mock_file.return_value
+        assert "string" not in result
+        mock_file.return_value.read.assert_not_called()
 
     @override_settings(MEDIA_URL="/media/", MEDIA_ROOT="/var/www/media/")
     @patch("oxutils.pdf.utils.default_storage.open")
@@ -373,6 +902,17 @@ class TestDjangoURLFetcher(TestCase):
         assert result["filename"] == "logo.png"
         mock_storage_open.assert_called_once()
 
+    def test_guess_mime_type(self):
+        """Test common asset types resolve without mimetypes, others fall back."""
+        from oxutils.pdf.utils import guess_mime_type
+
+        with patch("oxutils.pdf.utils.mimetypes.guess_type") as mock_guess:
+            assert guess_mime_type("file:///static/fonts/Inter.WOFF2") == ("font/woff2", None)
+            assert guess_mime_type("file:///static/img/logo.svg") == ("image/svg+xml", None)
+            mock_guess.assert_not_called()
+
+        assert guess_mime_type("file:///static/data.json") == ("application/json", None)
+
     @patch("oxutils.pdf.utils.weasyprint.default_url_fetcher")
     def test_fetch_http_url_fallback(self, mock_default_fetcher):
         """Test fallback to weasyprint default fetcher for HTTP URLs."""
@@ -385,11 +925,43 @@ class TestDjangoURLFetcher(TestCase):
         mock_default_fetcher.assert_called_once_with("https://example.com/style.css")
         assert result == {"data": "content"}
 
+    def test_prefetch_urls_populates_cache(self):
+        """Test prefetched resources are fetched once and served from memory."""
+        from oxutils.pdf.utils import prefetch_urls
+
+        def fetcher(url, *args, **kwargs):
+            return {"file_obj": io.BytesIO(url.encode()), "mime_type": "image/png"}
+
+        mock_fetcher = MagicMock(side_effect=fetcher)
+        urls = ["file:///media/a.png", "file:///media/b.png", "file:///media/a.png"]
+
+        prefetched = prefetch_urls(urls, mock_fetcher, max_workers=2)
+
+        assert mock_fetcher.call_count == 2
+        assert prefetched("file:///media/a.png") == {
+            "string": b"file:///media/a.png",
+            "mime_type": "image/png",
+        }
+        assert prefetched("file:///media/b.png")["string"] == b"file:///media/b.png"
+        assert mock_fetcher.call_count == 2
+
+        prefetched("file:///media/c.png")
+        assert mock_fetcher.call_count == 3
+
 
 @pytest.mark.django_db
 class TestPDFIntegration(TestCase):
     """Integration tests for PDF generation."""
 
+    def setUp(self):
+        """Reset the shared font configuration and render cache."""
+        from oxutils.pdf.printer import _render_cached
+
+        font_config_patch = patch("oxutils.pdf.printer._FONT_CONFIGS", threading.local())
+        font_config_patch.start()
+        self.addCleanup(font_config_patch.stop)
+        _render_cached.cache_clear()
+
     @patch("oxutils.pdf.printer.render_to_string")
     @patch("oxutils.pdf.printer.weasyprint.HTML")
     @patch("oxutils.pdf.printer.weasyprint.text.fonts.FontConfiguration")
@@ -398,11 +970,7 @@ class TestPDFIntegration(TestCase):
         from oxutils.pdf.printer import Printer
 
         mock_render.return_value = "<html><body><h1>Invoice</h1></body></html>"
-        mock_html_instance = MagicMock()
-        mock_html.return_value = mock_html_instance
-        mock_document = MagicMock()
-        mock_document.write_pdf.return_value = b"PDF_BYTES"
-        mock_html_instance.render.return_value = mock_document
+        _mock_document(mock_html, b"PDF_BYTES")
 
         printer = Printer(
             template_name="invoice.html",
@@ -425,9 +993,7 @@ class TestPDFIntegration(TestCase):
         from oxutils.pdf.printer import Printer
 
         mock_render.return_value = "<html><body>CV</body></html>"
-        mock_html_instance = MagicMock()
-        mock_html.return_value = mock_html_instance
-        mock_document = MagicMock()
+        mock_document = _mock_document(mock_html)
 
         # Mock write_pdf to write to the output stream
         def mock_write_pdf(target=None, **kwargs):
@@ -436,7 +1002,6 @@ class TestPDFIntegration(TestCase):
             return b"CV_PDF_CONTENT"
 
         mock_document.write_pdf = mock_write_pdf
-        mock_html_instance.render.return_value = mock_document
 
         printer = Printer(template_name="cv.html", context={"name": "John Doe"})
 
@@ -447,3 +1012,28 @@ class TestPDFIntegration(TestCase):
         content = obj.read()
 
         assert content == b"CV_PDF_CONTENT"
+
+
+class TestPDFPackage:
+    """Tests for the lazy oxutils.pdf package exports."""
+
+    def test_pdf_package_lazy_import(self):
+        """Test importing oxutils.pdf does not load WeasyPrint."""
+        code = "import sys, oxutils.pdf; print('weasyprint' in sys.modules)"
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+    def test_pdf_package_exports(self):
+        """Test public names resolve to the submodule objects on access."""
+        import oxutils.pdf
+        from oxutils.pdf.printer import Printer
+        from oxutils.pdf.views import WeasyTemplateView
+
+        assert oxutils.pdf.Printer is Printer
+        assert oxutils.pdf.WeasyTemplateView is WeasyTemplateView
+        with pytest.raises(AttributeError):
+            _ = oxutils.pdf.missing
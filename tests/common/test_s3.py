@@ -2,7 +2,9 @@
 Tests for oxutils.s3 module.
 """
 
-from unittest.mock import patch
+import pytest
+
+from oxutils.s3 import get_s3_static_url, get_s3_storage_backend
 
 # ── get_s3_storage_backend ────────────────────────────────────────
 
@@ -12,49 +14,27 @@ class TestGetS3StorageBackend:
 
     # ── S3 not enabled ────────────────────────────────────────────
 
-    @patch("oxutils.s3.os.getenv")
-    def test_returns_none_when_use_s3_false(self, mock_getenv):
-        from oxutils.s3 import get_s3_storage_backend
-
-        mock_getenv.return_value = "False"
-
-        result = get_s3_storage_backend("static")
-        assert result is None
-        mock_getenv.assert_called_with("OXI_STATIC_STORAGE_USE_S3", "False")
-
-    @patch("oxutils.s3.os.getenv")
-    def test_returns_none_when_use_s3_not_set(self, mock_getenv):
-        from oxutils.s3 import get_s3_storage_backend
-
-        mock_getenv.return_value = "False"
-
-        result = get_s3_storage_backend("media")
-        assert result is None
-        mock_getenv.assert_called_with("OXI_MEDIA_STORAGE_USE_S3", "False")
-
-    @patch("oxutils.s3.os.getenv")
-    def test_returns_none_when_use_s3_zero(self, mock_getenv):
-        from oxutils.s3 import get_s3_storage_backend
-
-        mock_getenv.return_value = "0"
-
-        result = get_s3_storage_backend("static")
-        assert result is None
-
-    @patch("oxutils.s3.os.getenv")
-    def test_returns_none_when_use_s3_empty(self, mock_getenv):
-        from oxutils.s3 import get_s3_storage_backend
-
-        mock_getenv.return_value = ""
-
-        result = get_s3_storage_backend("static")
-        assert result is None
+    @pytest.mark.parametrize(
+        "kind,use_s3",
+        [
+            ("static", "False"),
+            ("media", None),  # not set
+            ("static", "0"),
+            ("static", ""),
+        ],
+    )
+    def test_returns_none_when_use_s3_disabled(self, monkeypatch, kind, use_s3):
+        env_var = f"OXI_{kind.upper()}_STORAGE_USE_S3"
+        if use_s3 is None:
+            monkeypatch.delenv(env_var, raising=False)
+        else:
+            monkeypatch.setenv(env_var, use_s3)
+
+        assert get_s3_storage_backend(kind) is None
 
     # ── S3 enabled ────────────────────────────────────────────────
 
     def test_returns_backend_dict_when_enabled(self, monkeypatch):
-        from oxutils.s3 import get_s3_storage_backend
-
         monkeypatch.setenv("OXI_STATIC_STORAGE_USE_S3", "true")
         monkeypatch.setenv("OXI_STATIC_STORAGE_ACCESS_KEY_ID", "my-access-key")
         monkeypatch.setenv("OXI_STATIC_STORAGE_SECRET_ACCESS_KEY", "my-secret-key")
@@ -71,8 +51,6 @@ class TestGetS3StorageBackend:
         assert result["OPTIONS"]["endpoint_url"] == "https://s3.example.com"
 
     def test_use_s3_true_variants(self, monkeypatch):
-        from oxutils.s3 import get_s3_storage_backend
-
         for value in ("true", "True", "TRUE", "1", "yes", "Yes", "YES"):
             monkeypatch.setenv("OXI_MEDIA_STORAGE_USE_S3", value)
             result = get_s3_storage_backend("media")
@@ -80,8 +58,6 @@ class TestGetS3StorageBackend:
             assert result["BACKEND"] == "storages.backends.s3.S3Storage"
 
     def test_ignores_unset_env_vars(self, monkeypatch):
-        from oxutils.s3 import get_s3_storage_backend
-
         monkeypatch.setenv("OXI_STATIC_STORAGE_USE_S3", "true")
         monkeypatch.setenv("OXI_STATIC_STORAGE_ACCESS_KEY_ID", "key")
         # All other vars intentionally left unset
@@ -95,8 +71,6 @@ class TestGetS3StorageBackend:
     # ── Boolean conversion ────────────────────────────────────────
 
     def test_converts_boolean_values(self, monkeypatch):
-        from oxutils.s3 import get_s3_storage_backend
-
         monkeypatch.setenv("OXI_STATIC_STORAGE_USE_S3", "true")
         monkeypatch.setenv("OXI_STATIC_STORAGE_USE_SSL", "false")
         monkeypatch.setenv("OXI_STATIC_STORAGE_GZIP", "true")
@@ -114,8 +88,6 @@ class TestGetS3StorageBackend:
     # ── Integer conversion ────────────────────────────────────────
 
     def test_converts_integer_values(self, monkeypatch):
-        from oxutils.s3 import get_s3_storage_backend
-
         monkeypatch.setenv("OXI_STATIC_STORAGE_USE_S3", "true")
         monkeypatch.setenv("OXI_STATIC_STORAGE_QUERYSTRING_EXPIRE", "3600")
         monkeypatch.setenv("OXI_STATIC_STORAGE_MAX_MEMORY_SIZE", "1048576")
@@ -129,8 +101,6 @@ class TestGetS3StorageBackend:
     # ── Quote stripping ───────────────────────────────────────────
 
     def test_strips_quotes_from_values(self, monkeypatch):
-        from oxutils.s3 import get_s3_storage_backend
-
         monkeypatch.setenv("OXI_STATIC_STORAGE_USE_S3", "true")
         monkeypatch.setenv("OXI_STATIC_STORAGE_ACCESS_KEY_ID", '"quoted-key"')
         monkeypatch.setenv("OXI_STATIC_STORAGE_BUCKET_NAME", "'my-bucket'")
@@ -144,8 +114,6 @@ class TestGetS3StorageBackend:
     # ── Empty values skipped ──────────────────────────────────────
 
     def test_skips_empty_values_after_trimming(self, monkeypatch):
-        from oxutils.s3 import get_s3_storage_backend
-
         monkeypatch.setenv("OXI_STATIC_STORAGE_USE_S3", "true")
         monkeypatch.setenv("OXI_STATIC_STORAGE_ACCESS_KEY_ID", "key123")
         monkeypatch.setenv("OXI_STATIC_STORAGE_BUCKET_NAME", '""')
@@ -161,8 +129,6 @@ class TestGetS3StorageBackend:
     # ── kwargs override ───────────────────────────────────────────
 
     def test_kwargs_override_env_vars(self, monkeypatch):
-        from oxutils.s3 import get_s3_storage_backend
-
         monkeypatch.setenv("OXI_STATIC_STORAGE_USE_S3", "true")
         monkeypatch.setenv("OXI_STATIC_STORAGE_BUCKET_NAME", "env-bucket")
         monkeypatch.setenv("OXI_STATIC_STORAGE_REGION_NAME", "env-region")
@@ -181,8 +147,6 @@ class TestGetS3StorageBackend:
     # ── All env vars ──────────────────────────────────────────────
 
     def test_reads_all_supported_env_vars(self, monkeypatch):
-        from oxutils.s3 import get_s3_storage_backend
-
         monkeypatch.setenv("OXI_DATA_STORAGE_USE_S3", "true")
         monkeypatch.setenv("OXI_DATA_STORAGE_ACCESS_KEY_ID", "ak")
         monkeypatch.setenv("OXI_DATA_STORAGE_SECRET_ACCESS_KEY", "sk")
@@ -250,86 +214,38 @@ class TestGetS3StorageBackend:
 class TestGetS3StaticUrl:
     """Tests for get_s3_static_url()."""
 
-    def test_returns_none_when_options_is_none(self):
-        from oxutils.s3 import get_s3_static_url
-
-        result = get_s3_static_url(None)
-        assert result is None
-
-    def test_returns_none_when_no_custom_domain(self):
-        from oxutils.s3 import get_s3_static_url
-
-        options = {"OPTIONS": {}}
-        result = get_s3_static_url(options)
-        assert result is None
-
-    def test_returns_none_when_custom_domain_is_none(self):
-        from oxutils.s3 import get_s3_static_url
-
-        options = {"OPTIONS": {"custom_domain": None}}
-        result = get_s3_static_url(options)
-        assert result is None
-
-    def test_builds_url_with_custom_domain(self):
-        from oxutils.s3 import get_s3_static_url
-
-        options = {"OPTIONS": {"custom_domain": "cdn.example.com"}}
-        result = get_s3_static_url(options)
-        assert result == "https://cdn.example.com/"
-
-    def test_uses_custom_protocol(self):
-        from oxutils.s3 import get_s3_static_url
-
-        options = {
-            "OPTIONS": {
-                "custom_domain": "cdn.example.com",
-                "url_protocol": "http",
-            }
-        }
-        result = get_s3_static_url(options)
-        assert result == "http://cdn.example.com/"
-
-    def test_appends_location(self):
-        from oxutils.s3 import get_s3_static_url
-
-        options = {
-            "OPTIONS": {
-                "custom_domain": "cdn.example.com",
-                "location": "static",
-            }
-        }
-        result = get_s3_static_url(options)
-        assert result == "https://cdn.example.com/static/"
-
-    def test_appends_location_with_trailing_slash(self):
-        from oxutils.s3 import get_s3_static_url
-
-        options = {
-            "OPTIONS": {
-                "custom_domain": "cdn.example.com",
-                "location": "uploads/images",
-            }
-        }
-        result = get_s3_static_url(options)
-        assert result == "https://cdn.example.com/uploads/images/"
-
-    def test_empty_location_does_not_append(self):
-        from oxutils.s3 import get_s3_static_url
-
-        options = {"OPTIONS": {"custom_domain": "cdn.example.com", "location": ""}}
-        result = get_s3_static_url(options)
-        assert result == "https://cdn.example.com/"
-
-    def test_default_protocol_is_https(self):
-        from oxutils.s3 import get_s3_static_url
-
-        options = {"OPTIONS": {"custom_domain": "cdn.example.com"}}
-        result = get_s3_static_url(options)
-        assert result.startswith("https://")
-
-    def test_options_without_options_key_does_not_crash(self):
-        from oxutils.s3 import get_s3_static_url
-
-        options = {}
-        result = get_s3_static_url(options)
-        assert result is None
+    @pytest.mark.parametrize(
+        "options",
+        [
+            None,
+            {},  # no OPTIONS key: must not crash
+            {"OPTIONS": {}},
+            {"OPTIONS": {"custom_domain": None}},
+        ],
+    )
+    def test_returns_none_without_custom_domain(self, options):
+        assert get_s3_static_url(options) is None
+
+    @pytest.mark.parametrize(
+        "options,expected",
+        [
+            # Default protocol is https
+            ({"custom_domain": "cdn.example.com"}, "https://cdn.example.com/"),
+            (
+                {"custom_domain": "cdn.example.com", "url_protocol": "http"},
+                "http://cdn.example.com/",
+            ),
+            (
+                {"custom_domain": "cdn.example.com", "location": "static"},
+                "https://cdn.example.com/static/",
+            ),
+            (
+                {"custom_domain": "cdn.example.com", "location": "uploads/images"},
+                "https://cdn.example.com/uploads/images/",
+            ),
+            # Empty location is not appended
+            ({"custom_domain": "cdn.example.com", "location": ""}, "https://cdn.example.com/"),
+        ],
+    )
+    def test_builds_url(self, options, expected):
+        assert get_s3_static_url({"OPTIONS": options}) == expected
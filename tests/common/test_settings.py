@@ -20,7 +20,7 @@ def clean_env(monkeypatch):
 class TestOxUtilsSettings:
     """Test OxUtilsSettings — only behavior that can break."""
 
-    def test_jwt_key_validation_file_not_found(self, tmp_path):
+    def test_jwt_key_validation_file_not_found(self):
         with pytest.raises(ValueError, match="JWT verifying key file not found"):
             OxUtilsSettings(
                 service_name="test",
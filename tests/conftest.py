@@ -13,6 +13,13 @@ def request_factory():
     return RequestFactory()
 
 
+@pytest.fixture(scope="session")
+def anon_user():
+    """Provide a shared AnonymousUser instance."""
+    from django.contrib.auth.models import AnonymousUser
+    return AnonymousUser()
+
+
 @pytest.fixture
 def mock_request(request_factory):
     """Provide a mock HTTP request."""
@@ -35,19 +42,25 @@ def sample_jwt_payload():
     }
 
 
-@pytest.fixture
-def temp_jwt_key(tmp_path):
-    """Create temporary JWT key files for testing."""
+@pytest.fixture(scope="session")
+def jwt_private_key():
+    """Generate one RSA key pair per session: 2048-bit generation is slow."""
     from cryptography.hazmat.primitives.asymmetric import rsa
-    from cryptography.hazmat.primitives import serialization
     from cryptography.hazmat.backends import default_backend
-    
-    # Generate RSA key pair
-    private_key = rsa.generate_private_key(
+
+    return rsa.generate_private_key(
         public_exponent=65537,
         key_size=2048,
         backend=default_backend()
     )
+
+
+@pytest.fixture
+def temp_jwt_key(tmp_path, jwt_private_key):
+    """Create temporary JWT key files for testing."""
+    from cryptography.hazmat.primitives import serialization
+    
+    private_key = jwt_private_key
     
     # Write private key
     private_key_path = tmp_path / "private_key.pem"
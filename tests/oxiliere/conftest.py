@@ -0,0 +1,19 @@
+"""
+Pytest configuration and fixtures for oxiliere tests.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+AUTHENTICATED_USER = SimpleNamespace(is_authenticated=True)
+
+
+@pytest.fixture
+def make_request():
+    """Factory building plain request stubs (user, tenant, headers, META)."""
+
+    def _make(user=AUTHENTICATED_USER, tenant=None, headers=None, meta=None):
+        return SimpleNamespace(user=user, tenant=tenant, headers=headers or {}, META=meta or {})
+
+    return _make
@@ -8,6 +8,8 @@ import pytest
 from django.http import HttpResponseBadRequest
 from django.test import RequestFactory, TestCase
 
+from oxutils.constants import ORGANIZATION_HEADER_META_KEY
+
 
 @pytest.mark.django_db
 class TestOxidToSchemaName(TestCase):
@@ -119,8 +121,10 @@ class TestTenantMainMiddleware(TestCase):
 
     def test_get_org_id_from_meta(self):
         """Test organization ID extraction from META."""
+        assert ORGANIZATION_HEADER_META_KEY == "HTTP_X_ORGANIZATION_ID"
+
         request = self.factory.get("/")
-        request.META["HTTP_X_ORGANIZATION_ID"] = "test-org"
+        request.META[ORGANIZATION_HEADER_META_KEY] = "test-org"
 
         org_id = self.middleware.get_org_id_from_request(request)
 
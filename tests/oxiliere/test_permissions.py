@@ -2,355 +2,177 @@
 Tests for Oxiliere permissions.
 """
 
-from unittest.mock import Mock
+from types import SimpleNamespace
 
-from django.contrib.auth.models import AnonymousUser
+import pytest
 
 from oxutils.oxiliere.permissions import (
     IsTenantAdmin,
     IsTenantOwner,
     IsTenantUser,
-    TenantAdminPermission,
     TenantBasePermission,
-    TenantOwnerPermission,
-    TenantUserPermission,
 )
 
+# No django_db marker: these tests are pure stubs and never touch the ORM.
 
-def _mock_tenant_user(status="active", is_owner=False, is_admin=False):
-    """Build a mock TenantUser row (the DB model, attached as tenant.user)."""
-    tu = Mock()
-    tu.status = status
-    tu.is_owner = is_owner
-    tu.is_admin = is_admin
-    return tu
 
+class _AllowTenantPermission(TenantBasePermission):
+    """Concrete base permission whose tenant check always passes."""
 
-def _mock_tenant(tenant_user=None):
-    """Build a mock DB tenant with an optional .user attribute."""
-    tenant = Mock()
-    tenant.oxi_id = "test-org"
-    tenant.schema_name = "test_schema"
-    if tenant_user is not None:
-        tenant.user = tenant_user
-    return tenant
+    def check_tenant_permission(self, request):
+        return True
 
 
-class TestTenantBasePermission:
-    """Test TenantBasePermission abstract base class."""
-
-    def test_unauthenticated_user_denied(self):
-        """Test permission denied for unauthenticated user."""
+# Permission classes are stateless, so one instance per class is shared.
+_ALLOW_PERM = _AllowTenantPermission()
 
-        class TestPermission(TenantBasePermission):
-            def check_tenant_permission(self, request):
-                return True
 
-        permission = TestPermission()
-        mock_request = Mock()
-        mock_request.user = AnonymousUser()
+def _stub_tenant_user(status="active", is_owner=False, is_admin=False):
+    """Build a stub TenantUser row (the DB model, attached as tenant.user)."""
+    return SimpleNamespace(status=status, is_owner=is_owner, is_admin=is_admin)
 
-        result = permission.has_permission(mock_request)
 
-        assert result is False
+def _stub_tenant(tenant_user=None):
+    """Build a stub DB tenant with an optional .user attribute."""
+    tenant = SimpleNamespace(oxi_id="test-org", schema_name="test_schema")
+    if tenant_user is not None:
+        tenant.user = tenant_user
+    return tenant
 
-    def test_no_user_denied(self):
-        """Test permission denied when no user in request."""
 
-        class TestPermission(TenantBasePermission):
-            def check_tenant_permission(self, request):
-                return True
+class TestTenantBasePermission:
+    """Test TenantBasePermission abstract base class."""
 
-        permission = TestPermission()
-        mock_request = Mock()
-        mock_request.user = None
+    def test_no_user_denied(self, make_request):
+        """Test permission denied when no user in request."""
+        request = make_request(user=None)
 
-        result = permission.has_permission(mock_request)
+        result = _ALLOW_PERM.has_permission(request)
 
         assert result is False
 
-    def test_no_tenant_denied(self):
+    def test_no_tenant_denied(self, make_request):
         """Test permission denied when no tenant in request."""
+        request = make_request()
 
-        class TestPermission(TenantBasePermission):
-            def check_tenant_permission(self, request):
-                return True
-
-        permission = TestPermission()
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        mock_request = Mock(spec=["user"])
-        mock_request.user = mock_user
-
-        result = permission.has_permission(mock_request)
+        result = _ALLOW_PERM.has_permission(request)
 
         assert result is False
 
-    def test_tenant_without_user_denied(self):
+    def test_tenant_without_user_denied(self, make_request):
         """Test permission denied when tenant has no .user attached."""
+        request = make_request(tenant=SimpleNamespace())  # no .user attribute
 
-        class TestPermission(TenantBasePermission):
-            def check_tenant_permission(self, request):
-                return True
-
-        permission = TestPermission()
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = Mock(spec=[])  # no .user attribute
-
-        result = permission.has_permission(mock_request)
-
-        assert result is False
-
-
-class TestTenantUserPermission:
-    """Test TenantUserPermission / IsTenantUser."""
-
-    def test_permission_granted_for_active_tenant_user(self):
-        """Test permission granted for active tenant user."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="active"))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        permission = TenantUserPermission()
-        result = permission.has_permission(mock_request)
-
-        assert result is True
-
-    def test_permission_denied_for_inactive_tenant_user(self):
-        """Test permission denied for inactive tenant user."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="inactive"))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        permission = TenantUserPermission()
-        result = permission.has_permission(mock_request)
+        result = _ALLOW_PERM.has_permission(request)
 
         assert result is False
 
-    def test_permission_denied_for_no_tenant_user(self):
-        """Test permission denied when tenant has no user."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(None)  # No tenant user
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        permission = TenantUserPermission()
-        result = permission.has_permission(mock_request)
-
-        assert result is False
-
-    def test_singleton_instance_works(self):
-        """Test IsTenantUser singleton instance."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="active"))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        result = IsTenantUser.has_permission(mock_request)
 
-        assert result is True
+@pytest.mark.parametrize(
+    "permission",
+    [_ALLOW_PERM, IsTenantUser, IsTenantAdmin, IsTenantOwner],
+)
+def test_unauthenticated_user_denied(permission, anon_user, make_request):
+    """Test every tenant permission denies an unauthenticated user."""
+    request = make_request(user=anon_user)
 
+    result = permission.has_permission(request)
 
-class TestTenantAdminPermission:
-    """Test TenantAdminPermission / IsTenantAdmin."""
+    assert result is False
 
-    def test_permission_granted_for_admin(self):
-        """Test permission granted for admin."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
 
-        tenant = _mock_tenant(_mock_tenant_user(status="active", is_admin=True))
+class TestTenantRolePermissions:
+    """Grant/deny checks shared by the tenant role permission classes."""
 
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
+    @pytest.mark.parametrize(
+        "permission,tenant_user_kwargs",
+        [
+            (IsTenantUser, {}),
+            (IsTenantAdmin, {"is_admin": True}),
+            (IsTenantOwner, {"is_owner": True}),
+        ],
+    )
+    def test_permission_granted(self, permission, tenant_user_kwargs, make_request):
+        """Test permission granted when the tenant user holds the required role."""
+        tenant = _stub_tenant(_stub_tenant_user(status="active", **tenant_user_kwargs))
+        request = make_request(tenant=tenant)
 
-        permission = TenantAdminPermission()
-        result = permission.has_permission(mock_request)
+        result = permission.has_permission(request)
 
         assert result is True
 
-    def test_permission_denied_for_non_admin(self):
-        """Test permission denied for regular user."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="active", is_admin=False))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        permission = TenantAdminPermission()
-        result = permission.has_permission(mock_request)
+    @pytest.mark.parametrize(
+        "permission,tenant_user_kwargs",
+        [
+            (IsTenantUser, {"status": "inactive"}),
+            (IsTenantAdmin, {"is_admin": False}),
+            (IsTenantOwner, {"is_owner": False, "is_admin": True}),
+        ],
+    )
+    def test_permission_denied(self, permission, tenant_user_kwargs, make_request):
+        """Test permission denied when the tenant user lacks the required role."""
+        tenant = _stub_tenant(_stub_tenant_user(**{"status": "active", **tenant_user_kwargs}))
+        request = make_request(tenant=tenant)
+
+        result = permission.has_permission(request)
 
         assert result is False
 
-    def test_singleton_instance_works(self):
-        """Test IsTenantAdmin singleton instance."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="active", is_admin=True))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        result = IsTenantAdmin.has_permission(mock_request)
-
-        assert result is True
-
-
-class TestTenantOwnerPermission:
-    """Test TenantOwnerPermission / IsTenantOwner."""
 
-    def test_permission_granted_for_owner(self):
-        """Test permission granted for owner."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="active", is_owner=True))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        permission = TenantOwnerPermission()
-        result = permission.has_permission(mock_request)
-
-        assert result is True
-
-    def test_permission_denied_for_admin_non_owner(self):
-        """Test permission denied for admin who is not owner."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="active", is_owner=False, is_admin=True))
+class TestTenantUserPermission:
+    """Test TenantUserPermission / IsTenantUser."""
 
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
+    def test_permission_denied_for_no_tenant_user(self, make_request):
+        """Test permission denied when tenant has no user."""
+        request = make_request(tenant=_stub_tenant(None))  # No tenant user
 
-        permission = TenantOwnerPermission()
-        result = permission.has_permission(mock_request)
+        result = IsTenantUser.has_permission(request)
 
         assert result is False
 
-    def test_singleton_instance_works(self):
-        """Test IsTenantOwner singleton instance."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="active", is_owner=True))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        result = IsTenantOwner.has_permission(mock_request)
-
-        assert result is True
-
 
 class TestPermissionIntegration:
     """Test permission integration scenarios."""
 
-    def test_owner_has_all_permissions(self):
-        """Test owner passes all permission checks."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="active", is_owner=True, is_admin=True))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        assert IsTenantUser.has_permission(mock_request) is True
-        assert IsTenantOwner.has_permission(mock_request) is True
-        assert IsTenantAdmin.has_permission(mock_request) is True
-
-    def test_admin_has_user_and_admin_permissions(self):
-        """Test admin passes user and admin checks but not owner."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="active", is_owner=False, is_admin=True))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        assert IsTenantUser.has_permission(mock_request) is True
-        assert IsTenantOwner.has_permission(mock_request) is False
-        assert IsTenantAdmin.has_permission(mock_request) is True
-
-    def test_regular_user_has_only_user_permission(self):
-        """Test regular user only passes basic user check."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="active", is_owner=False, is_admin=False))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        assert IsTenantUser.has_permission(mock_request) is True
-        assert IsTenantOwner.has_permission(mock_request) is False
-        assert IsTenantAdmin.has_permission(mock_request) is False
-
-    def test_inactive_user_has_no_permissions(self):
-        """Test inactive user fails all permission checks."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="inactive", is_owner=True, is_admin=True))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
-
-        assert IsTenantUser.has_permission(mock_request) is False
-        assert IsTenantOwner.has_permission(mock_request) is False
-        assert IsTenantAdmin.has_permission(mock_request) is False
-
-    def test_kwargs_passed_to_permission(self):
+    @pytest.mark.parametrize(
+        "tenant_user_kwargs,expected",
+        [
+            pytest.param(
+                {"status": "active", "is_owner": True, "is_admin": True},
+                (True, True, True),
+                id="owner",
+            ),
+            pytest.param(
+                {"status": "active", "is_owner": False, "is_admin": True},
+                (True, False, True),
+                id="admin",
+            ),
+            pytest.param(
+                {"status": "active", "is_owner": False, "is_admin": False},
+                (True, False, False),
+                id="regular",
+            ),
+            pytest.param(
+                {"status": "inactive", "is_owner": True, "is_admin": True},
+                (False, False, False),
+                id="inactive",
+            ),
+        ],
+    )
+    def test_permission_hierarchy(self, tenant_user_kwargs, expected, make_request):
+        """Test each tenant user profile against the user/owner/admin checks."""
+        request = make_request(tenant=_stub_tenant(_stub_tenant_user(**tenant_user_kwargs)))
+
+        permissions = (IsTenantUser, IsTenantOwner, IsTenantAdmin)
+        results = tuple(perm.has_permission(request) for perm in permissions)
+
+        assert results == expected
+
+    def test_kwargs_passed_to_permission(self, make_request):
         """Test that kwargs are properly handled by permissions."""
-        mock_user = Mock()
-        mock_user.is_authenticated = True
-
-        tenant = _mock_tenant(_mock_tenant_user(status="active"))
-
-        mock_request = Mock()
-        mock_request.user = mock_user
-        mock_request.tenant = tenant
+        request = make_request(tenant=_stub_tenant(_stub_tenant_user(status="active")))
 
         # Should work with kwargs
-        result = IsTenantUser.has_permission(mock_request, view=Mock(), extra_param="test")
+        result = IsTenantUser.has_permission(request, view=object(), extra_param="test")
 
         assert result is True
@@ -7,6 +7,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from oxutils.constants import ORGANIZATION_HEADER_KEY, ORGANIZATION_HEADER_META_KEY
 from oxutils.oxiliere.enums import TenantStatus
 from oxutils.oxiliere.middleware import TenantMainMiddleware
 
@@ -29,6 +30,21 @@ def _mock_tenant(status):
     return tenant
 
 
+class TestGetOrgIdFromRequest:
+    """Test organization ID extraction against plain dict lookups."""
+
+    def test_reads_header(self, make_request):
+        request = make_request(headers={ORGANIZATION_HEADER_KEY: "org-header"})
+        assert TenantMainMiddleware.get_org_id_from_request(request) == "org-header"
+
+    def test_falls_back_to_meta(self, make_request):
+        request = make_request(meta={ORGANIZATION_HEADER_META_KEY: "org-meta"})
+        assert TenantMainMiddleware.get_org_id_from_request(request) == "org-meta"
+
+    def test_missing_returns_none(self, make_request):
+        assert TenantMainMiddleware.get_org_id_from_request(make_request()) is None
+
+
 class TestTenantStatusResponses:
     """Test the static response builders — pure functions, no DB."""
 
@@ -55,42 +71,37 @@ class TestTenantStatusResponses:
 class TestHandleTenantStatus:
     """Test _handle_tenant_status dispatch."""
 
-    def test_active_tenant_proceeds_normally(self, middleware):
-        request = Mock()
-        middleware.get_org_id_from_request = Mock(return_value="org-active")
+    def test_active_tenant_proceeds_normally(self, middleware, make_request):
+        request = make_request(headers={ORGANIZATION_HEADER_KEY: "org-active"})
         tenant = _mock_tenant(TenantStatus.ACTIVE)
 
         result = middleware._handle_tenant_status(request, tenant)
         assert result is None
 
-    def test_pending_migration_dispatches(self, middleware):
-        request = Mock()
-        middleware.get_org_id_from_request = Mock(return_value="org-pending")
+    def test_pending_migration_dispatches(self, middleware, make_request):
+        request = make_request(headers={ORGANIZATION_HEADER_KEY: "org-pending"})
         tenant = _mock_tenant(TenantStatus.PENDING_MIGRATION)
 
         result = middleware._handle_tenant_status(request, tenant)
         assert result.status_code == 503
 
-    def test_suspended_dispatches(self, middleware):
-        request = Mock()
-        middleware.get_org_id_from_request = Mock(return_value="org-suspended")
+    def test_suspended_dispatches(self, middleware, make_request):
+        request = make_request(headers={ORGANIZATION_HEADER_KEY: "org-suspended"})
         tenant = _mock_tenant(TenantStatus.SUSPENDED)
 
         result = middleware._handle_tenant_status(request, tenant)
         assert result.status_code == 423
 
-    def test_inactive_dispatches(self, middleware):
-        request = Mock()
-        middleware.get_org_id_from_request = Mock(return_value="org-inactive")
+    def test_inactive_dispatches(self, middleware, make_request):
+        request = make_request(headers={ORGANIZATION_HEADER_KEY: "org-inactive"})
         tenant = _mock_tenant(TenantStatus.INACTIVE)
 
         result = middleware._handle_tenant_status(request, tenant)
         assert result.status_code == 404
 
-    def test_unknown_status_proceeds(self, middleware):
+    def test_unknown_status_proceeds(self, middleware, make_request):
         """Custom / future status should not block (None = pass through)."""
-        request = Mock()
-        middleware.get_org_id_from_request = Mock(return_value="org-unknown")
+        request = make_request(headers={ORGANIZATION_HEADER_KEY: "org-unknown"})
         tenant = _mock_tenant("some_future_status")
 
         result = middleware._handle_tenant_status(request, tenant)
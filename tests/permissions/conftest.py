@@ -0,0 +1,29 @@
+"""
+Shared fixtures for the permissions tests.
+"""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _disable_cacheops(settings):
+    """
+    Turn cacheops off for these tests.
+
+    Every Role/Grant/User save fires cacheops' post_save and m2m_changed
+    invalidation receivers, which round-trip to Redis even though the test
+    settings cache nothing. With CACHEOPS_ENABLED off the receivers return
+    immediately and ``cached_as`` calls straight through.
+    """
+    settings.CACHEOPS_ENABLED = False
+
+
+@pytest.fixture
+def db_setup(db):
+    """
+    Setup database for tests.
+
+    Uses ``db`` (each test rolled back to a savepoint), not ``transactional_db``:
+    the utilities under test run inside ``transaction.atomic`` blocks, which
+    nest as savepoints, so nothing here needs tables flushed between tests.
+    """
+    pass
@@ -1,11 +1,14 @@
 """
 Tests for the permissions module.
 """
+from types import SimpleNamespace
+
 import pytest
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ImproperlyConfigured
-from django.test import override_settings
-from unittest.mock import Mock, patch, MagicMock
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 
 from oxutils.permissions.models import Role, Group, RoleGrant, Grant, UserGroup
 from oxutils.permissions.utils import (
@@ -45,19 +48,13 @@ from oxutils.permissions.perms import (
 User = get_user_model()
 
 
-@pytest.fixture
-def db_setup(db):
-    """Setup database for tests."""
-    pass
-
-
+# No passwords: nothing here logs in, and PBKDF2 hashing dominated setup.
 @pytest.fixture
 def test_user(db_setup):
-    """Create a test user."""
+    """Create a test user (no usable password)."""
     return User.objects.create_user(
         username='testuser',
-        email='test@example.com',
-        password='testpass123'
+        email='test@example.com'
     )
 
 
@@ -67,7 +64,6 @@ def admin_user(db_setup):
     return User.objects.create_user(
         username='admin',
         email='admin@example.com',
-        password='adminpass123',
         is_staff=True
     )
 
@@ -78,26 +74,6 @@ def editor_role(db_setup):
     return Role.objects.create(slug='editor', name='Editor')
 
 
-@pytest.fixture
-def viewer_role(db_setup):
-    """Create a viewer role."""
-    return Role.objects.create(slug='viewer', name='Viewer')
-
-
-@pytest.fixture
-def admin_role(db_setup):
-    """Create an admin role."""
-    return Role.objects.create(slug='admin', name='Administrator')
-
-
-@pytest.fixture
-def staff_group(db_setup, editor_role, viewer_role):
-    """Create a staff group with roles."""
-    group = Group.objects.create(slug='staff', name='Staff')
-    group.roles.add(editor_role, viewer_role)
-    return group
-
-
 @pytest.fixture
 def editor_role_grant(db_setup, editor_role):
     """Create a role grant for editor on articles."""
@@ -109,122 +85,203 @@ def editor_role_grant(db_setup, editor_role):
     )
 
 
-@pytest.fixture
-def viewer_role_grant(db_setup, viewer_role):
-    """Create a role grant for viewer on articles."""
-    return RoleGrant.objects.create(
-        role=viewer_role,
-        scope='articles',
-        actions=['r'],
-        context={}
+def _build_permissions_world():
+    """Create the editor/viewer roles, their article grants and the staff group in bulk."""
+    editor, viewer = Role.objects.bulk_create([
+        Role(slug='editor', name='Editor'),
+        Role(slug='viewer', name='Viewer'),
+    ])
+    staff = Group.objects.create(slug='staff', name='Staff')
+    staff.roles.add(editor, viewer)
+    # bulk_create skips RoleGrant.save(), so expand the actions as clean() would.
+    editor_grant, viewer_grant = RoleGrant.objects.bulk_create([
+        RoleGrant(role=editor, scope='articles', actions=expand_actions(['r', 'w']), context={}),
+        RoleGrant(role=viewer, scope='articles', actions=expand_actions(['r']), context={}),
+    ])
+    return SimpleNamespace(
+        editor=editor,
+        viewer=viewer,
+        staff=staff,
+        editor_grant=editor_grant,
+        viewer_grant=viewer_grant,
     )
 
 
+@pytest.fixture
+def permissions_world(db_setup):
+    """The shared roles, grants and staff group (see _build_permissions_world)."""
+    return _build_permissions_world()
+
+
 class TestActionsExpansion:
     """Test action expansion and collapse utilities."""
 
-    def test_expand_actions_basic(self):
-        """Test basic action expansion."""
-        assert set(expand_actions(['r'])) == {'r'}
-        assert set(expand_actions(['w'])) == {'r', 'w'}
-        assert set(expand_actions(['d'])) == {'r', 'w', 'd'}
-        assert set(expand_actions(['u'])) == {'r', 'u'}
-        assert set(expand_actions(['a'])) == {'a', 'r'}
-
-    def test_expand_actions_multiple(self):
-        """Test expansion with multiple actions."""
-        assert set(expand_actions(['r', 'w'])) == {'r', 'w'}
-        assert set(expand_actions(['r', 'd'])) == {'r', 'w', 'd'}
-        assert set(expand_actions(['w', 'u'])) == {'r', 'w', 'u'}
-        assert set(expand_actions(['a', 'w'])) == {'a', 'r', 'w'}
-
-    def test_collapse_actions(self):
+    @pytest.mark.parametrize(
+        "actions,expected",
+        [
+            (['r'], {'r'}),
+            (['w'], {'r', 'w'}),
+            (['d'], {'r', 'w', 'd'}),
+            (['u'], {'r', 'u'}),
+            (['a'], {'a', 'r'}),
+            (['r', 'w'], {'r', 'w'}),
+            (['r', 'd'], {'r', 'w', 'd'}),
+            (['w', 'u'], {'r', 'w', 'u'}),
+            (['a', 'w'], {'a', 'r', 'w'}),
+        ],
+    )
+    def test_expand_actions(self, actions, expected):
+        """Test action expansion to every implied action."""
+        assert set(expand_actions(actions)) == expected
+
+    @pytest.mark.parametrize(
+        "actions,expected",
+        [
+            (['r'], {'r'}),
+            (['r', 'w'], {'w'}),
+            (['r', 'w', 'd'], {'d'}),
+            (['r', 'u'], {'u'}),  # u implies r, so only u remains
+            (['a', 'r'], {'a'}),  # a implies r, so only a remains
+        ],
+    )
+    def test_collapse_actions(self, actions, expected):
         """Test action collapse to root actions."""
-        assert set(collapse_actions(['r'])) == {'r'}
-        assert set(collapse_actions(['r', 'w'])) == {'w'}
-        assert set(collapse_actions(['r', 'w', 'd'])) == {'d'}
-        assert set(collapse_actions(['r', 'u'])) == {'u'}  # u implies r, so only u remains
-        assert set(collapse_actions(['a', 'r'])) == {'a'}  # a implies r, so only a remains
+        assert set(collapse_actions(actions)) == expected
+
+    def test_actions_results_are_fresh(self):
+        """Test table lookups return independent containers."""
+        first = expand_actions(['w', 'u'])
+        second = expand_actions(['u', 'w'])
+        first.append('x')
+
+        assert second == ['r', 'u', 'w']
+        assert collapse_actions(['r', 'w']) is not collapse_actions(['w', 'r'])
 
+    def test_unknown_actions_pass_through(self):
+        """Test actions outside the hierarchy are kept as-is."""
+        assert set(expand_actions(['x', 'w'])) == {'x', 'w', 'r'}
+        assert set(collapse_actions(['x', 'w', 'r'])) == {'x', 'w'}
 
-class TestRoleAssignment:
+
+class PermissionsTestCase(TestCase):
+    """
+    Shared data for the class-based assignment tests.
+
+    setUpTestData creates the users, roles and grants once per class; each
+    test then runs inside a savepoint rolled back on exit.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.test_user = User.objects.create_user(username='testuser', email='test@example.com')
+        cls.admin_user = User.objects.create_user(
+            username='admin', email='admin@example.com', is_staff=True
+        )
+        world = _build_permissions_world()
+        cls.editor_role = world.editor
+        cls.staff_group = world.staff
+
+
+class TestRoleAssignment(PermissionsTestCase):
     """Test role assignment and revocation."""
 
-    def test_assign_role_creates_grants(self, test_user, editor_role, editor_role_grant, admin_user):
+    def test_assign_role_creates_grants(self):
         """Test that assigning a role creates appropriate grants."""
-        assign_role(test_user, 'editor', 'articles', by=admin_user)
+        assign_role(self.test_user, 'editor', 'articles', by=self.admin_user)
         
-        grant = Grant.objects.get(user=test_user, scope='articles', role=editor_role)
+        grant = Grant.objects.get(user=self.test_user, scope='articles', role=self.editor_role)
         assert grant is not None
         assert set(grant.actions) == {'r', 'w'}
-        assert grant.created_by == admin_user
+        assert grant.created_by == self.admin_user
 
-    def test_assign_role_not_found(self, test_user, admin_user):
+    def test_assign_role_not_found(self):
         """Test assigning a non-existent role raises exception."""
         with pytest.raises(RoleNotFoundException):
-            assign_role(test_user, 'nonexistent', 'articles', by=admin_user)
+            assign_role(self.test_user, 'nonexistent', 'articles', by=self.admin_user)
 
-    def test_assign_role_already_assigned(self, test_user, editor_role, editor_role_grant, admin_user):
+    def test_assign_role_already_assigned(self):
         """Test assigning an already assigned role creates duplicate grants."""
-        assign_role(test_user, 'editor', 'articles', by=admin_user)
+        assign_role(self.test_user, 'editor', 'articles', by=self.admin_user)
         
         # Second assignment should work (creates duplicate grants)
-        assign_role(test_user, 'editor', 'articles', by=admin_user)
+        assign_role(self.test_user, 'editor', 'articles', by=self.admin_user)
         
         # Check we have grants
-        assert Grant.objects.filter(user=test_user, role=editor_role).count() >= 1
+        assert Grant.objects.filter(user=self.test_user, role=self.editor_role).exists()
 
-    def test_revoke_role(self, test_user, editor_role, editor_role_grant, admin_user):
+    def test_revoke_role(self):
         """Test revoking a role removes grants."""
-        assign_role(test_user, 'editor', 'articles', by=admin_user)
+        assign_role(self.test_user, 'editor', 'articles', by=self.admin_user)
         
-        deleted_count, info = revoke_role(test_user, 'editor', 'articles')
+        deleted_count, info = revoke_role(self.test_user, 'editor', 'articles')
         
         assert deleted_count > 0
-        assert not Grant.objects.filter(user=test_user, role=editor_role).exists()
+        assert not Grant.objects.filter(user=self.test_user, role=self.editor_role).exists()
 
-    def test_revoke_role_not_found(self, test_user):
+    def test_revoke_role_not_found(self):
         """Test revoking a non-existent role raises exception."""
         with pytest.raises(RoleNotFoundException):
-            revoke_role(test_user, 'nonexistent', 'articles')
+            revoke_role(self.test_user, 'nonexistent', 'articles')
 
 
-class TestGroupAssignment:
+class TestGroupAssignment(PermissionsTestCase):
     """Test group assignment and revocation."""
 
-    def test_assign_group(self, test_user, staff_group, editor_role_grant, viewer_role_grant, admin_user):
+    def test_assign_group(self):
         """Test assigning a group creates grants for all roles."""
-        user_group = assign_group(test_user, 'staff', by=admin_user)
+        user_group = assign_group(self.test_user, 'staff', by=self.admin_user)
         
         assert user_group is not None
-        assert user_group.user == test_user
-        assert user_group.group == staff_group
+        assert user_group.user == self.test_user
+        assert user_group.group == self.staff_group
         
         # Check grants were created
-        grants = Grant.objects.filter(user=test_user, user_group=user_group)
-        assert grants.count() > 0
+        grants = Grant.objects.filter(user=self.test_user, user_group=user_group)
+        assert grants.exists()
 
-    def test_assign_group_not_found(self, test_user, admin_user):
+    def test_assign_group_not_found(self):
         """Test assigning a non-existent group raises exception."""
         with pytest.raises(GroupNotFoundException):
-            assign_group(test_user, 'nonexistent', by=admin_user)
+            assign_group(self.test_user, 'nonexistent', by=self.admin_user)
 
-    def test_assign_group_already_assigned(self, test_user, staff_group, editor_role_grant, viewer_role_grant, admin_user):
+    def test_assign_group_already_assigned(self):
         """Test assigning an already assigned group raises exception."""
-        assign_group(test_user, 'staff', by=admin_user)
+        assign_group(self.test_user, 'staff', by=self.admin_user)
         
         with pytest.raises(GroupAlreadyAssignedException):
-            assign_group(test_user, 'staff', by=admin_user)
+            assign_group(self.test_user, 'staff', by=self.admin_user)
 
-    def test_revoke_group(self, test_user, staff_group, editor_role_grant, viewer_role_grant, admin_user):
+    def test_revoke_group(self):
         """Test revoking a group removes all associated grants."""
-        user_group = assign_group(test_user, 'staff', by=admin_user)
+        user_group = assign_group(self.test_user, 'staff', by=self.admin_user)
         
-        deleted_count, info = revoke_group(test_user, 'staff')
+        deleted_count, info = revoke_group(self.test_user, 'staff')
         
         assert deleted_count > 0
-        assert not UserGroup.objects.filter(user=test_user, group=staff_group).exists()
-        assert not Grant.objects.filter(user=test_user, user_group=user_group).exists()
+        assert not UserGroup.objects.filter(user=self.test_user, group=self.staff_group).exists()
+        assert not Grant.objects.filter(user=self.test_user, user_group=user_group).exists()
+
+    def test_assign_group_inserts_grants_in_bulk(self):
+        """Test assigning a group creates all its grants with a single INSERT."""
+        with CaptureQueriesContext(connection) as ctx:
+            assign_group(self.test_user, 'staff', by=self.admin_user)
+
+        grant_inserts = [
+            q for q in ctx.captured_queries
+            if q['sql'].startswith('INSERT INTO "permissions_grant"')
+        ]
+        assert len(grant_inserts) == 1
+        assert Grant.objects.filter(user=self.test_user).count() == 2
+
+    def test_assign_group_updates_existing_grant(self):
+        """Test a direct grant for the same role and scope is moved onto the group."""
+        assign_role(self.test_user, 'editor', 'articles', by=self.admin_user)
+
+        user_group = assign_group(self.test_user, 'staff', by=self.admin_user)
+
+        grant = Grant.objects.get(user=self.test_user, role=self.editor_role, scope='articles')
+        assert grant.user_group == user_group
+        assert Grant.objects.filter(user=self.test_user).count() == 2
 
 
 class TestPermissionCheck:
@@ -310,15 +367,17 @@ class TestGrantOverride:
         """Test overriding a grant with new actions."""
         assign_role(test_user, 'editor', 'articles', by=admin_user)
         
+        grant_qs = Grant.objects.filter(user=test_user, scope='articles').only('locked', 'actions')
+
         # Check initial state
-        grant_before = Grant.objects.get(user=test_user, scope='articles')
+        grant_before = grant_qs.get()
         assert 'w' in grant_before.actions
         
         # Override with new actions (only 'r')
         override_grant(test_user, 'articles', actions=['r'])
         
         # Grant should exist with only 'r' action
-        grant_after = Grant.objects.get(user=test_user, scope='articles')
+        grant_after = grant_qs.get()
         assert grant_after.locked is True  # Grant is now locked (custom)
         assert 'r' in grant_after.actions
         assert 'w' not in grant_after.actions
@@ -340,13 +399,13 @@ class TestGrantOverride:
 class TestGroupSync:
     """Test group synchronization."""
 
-    def test_group_sync_updates_grants(self, test_user, staff_group, editor_role_grant, viewer_role_grant, admin_user):
+    def test_group_sync_updates_grants(self, test_user, permissions_world, admin_user):
         """Test group sync updates grants after RoleGrant changes."""
         assign_group(test_user, 'staff', by=admin_user)
         
         # Modify role grant
-        editor_role_grant.actions = ['r', 'w', 'd']
-        editor_role_grant.save()
+        permissions_world.editor_grant.actions = ['r', 'w', 'd']
+        permissions_world.editor_grant.save()
         
         # Sync group
         stats = group_sync('staff')
@@ -355,39 +414,51 @@ class TestGroupSync:
         assert stats['grants_updated'] > 0
         
         # Check grant was updated
-        grant = Grant.objects.get(user=test_user, scope='articles', role=editor_role_grant.role)
+        grant = Grant.objects.get(user=test_user, scope='articles', role=permissions_world.editor_grant.role)
         assert 'd' in grant.actions
 
-    def test_group_sync_preserves_overrides(self, test_user, staff_group, editor_role_grant, editor_role, admin_user):
+    def test_group_sync_query_count_is_constant(self, test_user, admin_user, permissions_world, django_assert_num_queries):
+        """Test group sync does not issue a query per member or role grant."""
+        assign_group(test_user, 'staff', by=admin_user)
+        assign_group(admin_user, 'staff', by=admin_user)
+
+        # group + prefetched roles, grants to delete + delete, user groups,
+        # role grants, locked grants, bulk insert, and the savepoint pair
+        with django_assert_num_queries(10):
+            stats = group_sync('staff')
+
+        assert stats == {'users_synced': 2, 'grants_updated': 4}
+
+    def test_group_sync_preserves_overrides(self, test_user, permissions_world, admin_user):
         """Test group sync preserves custom overridden grants."""
+        locked_grant = Grant.objects.filter(
+            user=test_user, scope='articles', role=permissions_world.editor, locked=True
+        ).only('actions')
+
         assign_group(test_user, 'staff', by=admin_user)
         
-        # Verify grant exists before override
-        assert Grant.objects.filter(user=test_user, scope='articles').exists()
-        
-        # Override a grant with specific role
+        # Override a grant with specific role (raises GrantNotFoundException
+        # if assign_group did not create it)
         override_grant(test_user, 'articles', actions=['r'], role='editor')
         
-        # Verify override worked - get the locked grant
-        grant_after_override = Grant.objects.get(user=test_user, scope='articles', role=editor_role, locked=True)
-        assert grant_after_override.locked is True  # Locked grant
+        # Verify override worked - the grant is now locked
+        assert locked_grant.exists()
         
         # Sync group
         stats = group_sync('staff')
         
         # Check override was preserved (locked grants should not be deleted)
-        grant_after_sync = Grant.objects.get(user=test_user, scope='articles', role=editor_role, locked=True)
-        assert grant_after_sync.locked is True  # Still locked
+        grant_after_sync = locked_grant.get()
         assert 'r' in grant_after_sync.actions
         assert 'w' not in grant_after_sync.actions
 
-    def test_group_sync_with_role_filter(self, test_user, staff_group, editor_role_grant, viewer_role_grant, admin_user):
+    def test_group_sync_with_role_filter(self, test_user, permissions_world, admin_user):
         """Test group sync with role_slugs parameter to sync specific roles only."""
         assign_group(test_user, 'staff', by=admin_user)
         
         # Modify editor role grant
-        editor_role_grant.actions = ['r', 'w', 'd']
-        editor_role_grant.save()
+        permissions_world.editor_grant.actions = ['r', 'w', 'd']
+        permissions_world.editor_grant.save()
         
         # Sync only editor role
         stats = group_sync('staff', role_slugs=['editor'])
@@ -396,11 +467,12 @@ class TestGroupSync:
         assert stats['grants_updated'] > 0
         
         # Check editor grant was updated
-        editor_grant = Grant.objects.get(user=test_user, scope='articles', role=editor_role_grant.role)
+        editor_grant = Grant.objects.get(user=test_user, scope='articles', role=permissions_world.editor_grant.role)
         assert 'd' in editor_grant.actions
 
-    def test_group_sync_with_scope_filter(self, test_user, staff_group, editor_role_grant, admin_user):
+    def test_group_sync_with_scope_filter(self, test_user, permissions_world, admin_user):
         """Test group sync with scope parameter for performance optimization."""
+        editor_role_grant = permissions_world.editor_grant
         # Create another role grant for different scope
         RoleGrant.objects.create(
             role=editor_role_grant.role,
@@ -425,13 +497,13 @@ class TestGroupSync:
         articles_grant = Grant.objects.get(user=test_user, scope='articles', role=editor_role_grant.role)
         assert 'd' in articles_grant.actions
 
-    def test_group_sync_with_role_and_scope_filter(self, test_user, staff_group, editor_role_grant, viewer_role_grant, admin_user):
+    def test_group_sync_with_role_and_scope_filter(self, test_user, permissions_world, admin_user):
         """Test group sync with both role_slugs and scope parameters."""
         assign_group(test_user, 'staff', by=admin_user)
         
         # Modify editor role grant
-        editor_role_grant.actions = ['r', 'w', 'd']
-        editor_role_grant.save()
+        permissions_world.editor_grant.actions = ['r', 'w', 'd']
+        permissions_world.editor_grant.save()
         
         # Sync only editor role for articles scope
         stats = group_sync('staff', role_slugs=['editor'], scope='articles')
@@ -440,7 +512,7 @@ class TestGroupSync:
         assert stats['grants_updated'] > 0
         
         # Check editor grant was updated
-        editor_grant = Grant.objects.get(user=test_user, scope='articles', role=editor_role_grant.role)
+        editor_grant = Grant.objects.get(user=test_user, scope='articles', role=permissions_world.editor_grant.role)
         assert 'd' in editor_grant.actions
 
 
@@ -453,11 +525,9 @@ class TestScopePermission:
         
         perm = ScopePermission('articles:r')
         
-        request = Mock()
-        request.user = test_user
-        controller = Mock()
+        request = SimpleNamespace(user=test_user)
         
-        assert perm.has_permission(request, controller) is True
+        assert perm.has_permission(request, None) is True
 
     def test_scope_permission_with_context(self, test_user, editor_role, admin_user):
         """Test ScopePermission with context."""
@@ -472,11 +542,14 @@ class TestScopePermission:
         
         perm = ScopePermission('articles:r', ctx={'tenant_id': 123})
         
-        request = Mock()
-        request.user = test_user
-        controller = Mock()
+        request = SimpleNamespace(user=test_user)
         
-        assert perm.has_permission(request, controller) is True
+        assert perm.has_permission(request, None) is True
+
+    def test_scope_permission_invalid_format(self):
+        """Test an invalid permission string is rejected when the class is built."""
+        with pytest.raises(ValueError, match="Format de permission invalide"):
+            ScopePermission('articles')
 
 
 class TestAccessManager:
@@ -557,6 +630,17 @@ class TestCacheCheck:
         result = cache_check(test_user, 'articles', ['r'])
         assert result is True
 
+    def test_cache_get_role_and_group(self, permissions_world):
+        """Test slug lookups return the objects and propagate DoesNotExist."""
+        from oxutils.permissions.caches import cache_get_group, cache_get_role
+
+        assert cache_get_role('editor') == permissions_world.editor
+        assert cache_get_group('staff') == permissions_world.staff
+        with pytest.raises(Role.DoesNotExist):
+            cache_get_role('nonexistent')
+        with pytest.raises(Group.DoesNotExist):
+            cache_get_group('nonexistent')
+
 
 class TestModels:
     """Test permission models."""
@@ -589,10 +673,10 @@ class TestModels:
         # Creating another with same role, scope, group should violate constraint
         # But Django may allow it if the constraint is not properly enforced
         # Let's just verify the first one was created
-        assert RoleGrant.objects.filter(
+        assert list(RoleGrant.objects.filter(
             role=editor_role,
             scope='articles',
-        ).count() == 1
+        )[:2]) == [rg1]
 
     def test_grant_unique_constraint(self, db_setup, test_user, editor_role):
         """Test Grant unique constraint."""
@@ -607,11 +691,11 @@ class TestModels:
         # The constraint is on (user, scope, role, user_group)
         # Creating another with same values should be prevented
         # But let's verify the first one was created
-        assert Grant.objects.filter(
+        assert list(Grant.objects.filter(
             user=test_user,
             scope='articles',
             user_group=None
-        ).count() == 1
+        )[:2]) == [g1]
 
 
 class TestParsePermission:
@@ -658,6 +742,23 @@ class TestParsePermission:
         with pytest.raises(ValueError, match="Format de permission invalide"):
             parse_permission('invalid')
 
+    def test_parse_permission_ignores_extra_segments(self):
+        """Test segments after the role are ignored."""
+        assert parse_permission('articles:r:editor:extra?tenant_id=1') == (
+            'articles', ['r'], 'editor', {'tenant_id': 1}
+        )
+
+    def test_parse_permission_results_are_fresh(self):
+        """Test mutating a parsed permission does not leak into later calls."""
+        _, actions, _, context = parse_permission('articles:rw?tag=a&tag=b')
+        actions.append('d')
+        context['tag'].append('c')
+        context['extra'] = 1
+
+        assert parse_permission('articles:rw?tag=a&tag=b') == (
+            'articles', ['r', 'w'], None, {'tag': ['a', 'b']}
+        )
+
 
 class TestAnyActionCheck:
     """Test any_action_check function."""
@@ -845,9 +946,8 @@ class TestScopeAnyActionPermission:
         
         assign_role(test_user, 'editor', 'articles', by=admin_user)
         
-        # Create mock request
-        request = Mock()
-        request.user = test_user
+        # Create request stub
+        request = SimpleNamespace(user=test_user)
         
         # User has 'r', permission checks for 'rwd' (any of them)
         permission = ScopeAnyActionPermission('articles:rwd')
@@ -867,8 +967,7 @@ class TestScopeAnyActionPermission:
         
         assign_role(test_user, 'editor', 'articles', by=admin_user)
         
-        request = Mock()
-        request.user = test_user
+        request = SimpleNamespace(user=test_user)
         
         permission = ScopeAnyActionPermission('articles:rwd:editor')
         assert permission.has_permission(request, None) is True
@@ -886,8 +985,7 @@ class TestScopeAnyActionPermission:
             context={'tenant_id': 123}
         )
         
-        request = Mock()
-        request.user = test_user
+        request = SimpleNamespace(user=test_user)
         
         permission = ScopeAnyActionPermission('articles:rwd?tenant_id=123')
         assert permission.has_permission(request, None) is True
@@ -914,8 +1012,7 @@ class TestScopeAnyPermission:
         
         assign_role(test_user, 'editor', 'articles', by=admin_user)
         
-        request = Mock()
-        request.user = test_user
+        request = SimpleNamespace(user=test_user)
         
         # User has 'articles:r', checking for ['articles:r', 'invoices:w']
         permission = ScopeAnyPermission('articles:r', 'invoices:w')
@@ -940,8 +1037,7 @@ class TestScopeAnyPermission:
         
         assign_role(test_user, 'editor', 'articles', by=admin_user)
         
-        request = Mock()
-        request.user = test_user
+        request = SimpleNamespace(user=test_user)
         
         # User has at least one of these
         permission = ScopeAnyPermission('articles:w', 'users:d', 'reports:r')
@@ -957,8 +1053,7 @@ class TestScopeAnyPermission:
         
         assign_role(test_user, 'editor', 'articles', by=admin_user)
         
-        request = Mock()
-        request.user = test_user
+        request = SimpleNamespace(user=test_user)
         
         permission = ScopeAnyPermission('articles:r:editor', 'invoices:w:admin')
         assert permission.has_permission(request, None) is True
@@ -983,8 +1078,7 @@ class TestScopeAnyPermission:
             context={'tenant_id': 456}
         )
         
-        request = Mock()
-        request.user = test_user
+        request = SimpleNamespace(user=test_user)
         
         permission = ScopeAnyPermission(
             'articles:r?tenant_id=123',
@@ -1020,7 +1114,7 @@ class TestActivateDeactivatePermissions:
         deactivate_user_permissions(test_user)
         assert not check(test_user, 'articles', ['r'])
 
-    def test_activate_by_scope(self, test_user, editor_role, editor_role_grant, viewer_role, viewer_role_grant, admin_user):
+    def test_activate_by_scope(self, test_user, permissions_world, admin_user):
         """Activate only grants for a specific scope."""
         assign_role(test_user, 'editor', 'articles', by=admin_user)
         assign_role(test_user, 'viewer', 'articles', by=admin_user)
@@ -1030,7 +1124,7 @@ class TestActivateDeactivatePermissions:
         activate_user_permissions(test_user, scope='articles')
         assert check(test_user, 'articles', ['r'])
 
-    def test_deactivate_by_scope(self, test_user, editor_role, editor_role_grant, viewer_role, viewer_role_grant, admin_user):
+    def test_deactivate_by_scope(self, test_user, permissions_world, admin_user):
         """Deactivate only grants for a specific scope."""
         # Le viewer_role_grant n'existe pas pour 'invoices', créons un grant manuel
         assign_role(test_user, 'editor', 'articles', by=admin_user)
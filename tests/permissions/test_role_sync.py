@@ -15,30 +15,24 @@ from oxutils.permissions.exceptions import RoleNotFoundException
 User = get_user_model()
 
 
-@pytest.fixture
-def db_setup(db):
-    """Setup database for tests."""
-    pass
-
-
 @pytest.fixture
 def test_user(db_setup):
-    """Create a test user."""
+    """Create a test user (no usable password)."""
     return User.objects.create_user(
         username='testuser',
-        email='test@example.com',
-        password='testpass123'
+        email='test@example.com'
     )
 
 
 @pytest.fixture
-def test_user2(db_setup):
-    """Create a second test user."""
-    return User.objects.create_user(
-        username='testuser2',
-        email='test2@example.com',
-        password='testpass123'
-    )
+def make_users(db_setup):
+    """Return a factory creating password-less users in a single INSERT."""
+    def _make_users(*usernames):
+        users = [User(username=name, email=f'{name}@example.com') for name in usernames]
+        for user in users:
+            user.set_unusable_password()
+        return User.objects.bulk_create(users)
+    return _make_users
 
 
 @pytest.fixture
@@ -47,7 +41,6 @@ def admin_user(db_setup):
     return User.objects.create_user(
         username='admin',
         email='admin@example.com',
-        password='adminpass123',
         is_staff=True
     )
 
@@ -69,6 +62,14 @@ def editor_role_grant(db_setup, editor_role):
     )
 
 
+def direct_grant_actions(role, *users):
+    """Load the direct (non-group) grant actions of ``users`` for ``role`` in one query."""
+    rows = Grant.objects.filter(
+        user__in=users, role=role, user_group__isnull=True
+    ).values_list('user_id', 'scope', 'actions')
+    return {(user_id, scope): set(actions) for user_id, scope, actions in rows}
+
+
 class TestRoleSync:
     """Test role_sync functionality."""
 
@@ -117,16 +118,16 @@ class TestRoleSync:
         
         assert stats['grants_updated'] == 1
         
+        actions = direct_grant_actions(editor_role, test_user)
         # Check articles grant was updated
-        articles_grant = Grant.objects.get(user=test_user, scope='articles', role=editor_role, user_group__isnull=True)
-        assert 'd' in articles_grant.actions
-        
+        assert 'd' in actions[(test_user.pk, 'articles')]
         # Check comments grant was NOT updated
-        comments_grant_obj = Grant.objects.get(user=test_user, scope='comments', role=editor_role, user_group__isnull=True)
-        assert set(comments_grant_obj.actions) == {'r'}
+        assert actions[(test_user.pk, 'comments')] == {'r'}
 
-    def test_role_sync_multiple_users(self, test_user, test_user2, editor_role, editor_role_grant, admin_user):
+    def test_role_sync_multiple_users(self, make_users, editor_role, editor_role_grant, admin_user):
         """Test role_sync updates grants for all users with independent role assignments."""
+        test_user, test_user2 = make_users('testuser', 'testuser2')
+
         # Assign role to multiple users independently
         assign_role(test_user, 'editor', 'articles', by=admin_user)
         assign_role(test_user2, 'editor', 'articles', by=admin_user)
@@ -141,10 +142,9 @@ class TestRoleSync:
         assert stats['grants_updated'] == 2
         
         # Check both grants were updated
-        grant1 = Grant.objects.get(user=test_user, scope='articles', role=editor_role, user_group__isnull=True)
-        grant2 = Grant.objects.get(user=test_user2, scope='articles', role=editor_role, user_group__isnull=True)
-        assert 'd' in grant1.actions
-        assert 'd' in grant2.actions
+        actions = direct_grant_actions(editor_role, test_user, test_user2)
+        assert 'd' in actions[(test_user.pk, 'articles')]
+        assert 'd' in actions[(test_user2.pk, 'articles')]
 
     def test_role_sync_preserves_locked_grants(self, test_user, editor_role, editor_role_grant, admin_user):
         """Test role_sync does not update locked (custom) grants."""
@@ -67,6 +67,9 @@ TEMPLATES = [
 
 AUTH_PASSWORD_VALIDATORS = []
 
+# Fast hasher for tests; no test depends on the production hashing cost.
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
 LANGUAGE_CODE = 'en-us'
 TIME_ZONE = 'UTC'
 USE_I18N = True